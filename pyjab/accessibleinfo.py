@@ -5,6 +5,7 @@ from ctypes import c_bool
 from ctypes import Structure
 from ctypes.wintypes import BOOL
 from ctypes.wintypes import WCHAR
+from typing import NamedTuple
 from pyjab.common.types import JOBJECT64
 from pyjab.config import (
     MAX_STRING_SIZE,
@@ -181,3 +182,18 @@ class VisibleChildrenInfo(Structure):
         ("returnedChildrenCount", c_int),
         ("children", JOBJECT64 * MAX_VISIBLE_CHILDREN),
     ]
+
+
+class VisibleChildren(NamedTuple):
+    """Visible children copied out of VisibleChildrenInfo."""
+
+    count: int
+    children: tuple
+
+    def __getitem__(self, key):
+        # keep the former dict keys working
+        if key == "returned_children_count":
+            return self.count
+        if key == "children":
+            return self.children
+        return tuple.__getitem__(self, key)
@@ -0,0 +1,26 @@
+"""
+The Java Access Bridge API callbacks are contained in the file AccessBridgeCallbacks.h.
+Your event handling functions must match these prototypes.
+
+You must call the function ReleaseJavaObject on every JOBJECT64
+returned through these event handlers once you are finished with them to prevent memory leaks in the JVM.
+"""
+
+from ctypes import CFUNCTYPE, c_long, c_wchar_p
+
+from pyjab.common.types import JOBJECT64
+
+# API Callbacks
+
+# typedef void (*AccessBridge_FocusLostFP) (long vmID, JOBJECT64 event, JOBJECT64 source);
+focus_lost_fp = CFUNCTYPE(None, c_long, JOBJECT64, JOBJECT64)
+
+# typedef void (*AccessBridge_PropertyChangeFP) (long vmID, JOBJECT64 event, JOBJECT64 source, wchar_t *property, wchar_t *oldValue, wchar_t *newValue);
+property_change_fp = CFUNCTYPE(
+    None, c_long, JOBJECT64, JOBJECT64, c_wchar_p, c_wchar_p, c_wchar_p
+)
+
+# typedef void (*AccessBridge_PropertyChildChangeFP) (long vmID, JOBJECT64 event, JOBJECT64 source, JOBJECT64 oldChild, JOBJECT64 newChild);
+property_child_change_fp = CFUNCTYPE(
+    None, c_long, JOBJECT64, JOBJECT64, JOBJECT64, JOBJECT64
+)
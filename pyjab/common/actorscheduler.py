@@ -23,7 +23,7 @@ class ActorScheduler:
         """
         Admit a newly started actor to the scheduler and give it a name
         """
-        self.logger.debug(f"msg queue append new actor '{name}'")
+        self.logger.debug("msg queue append new actor '%s'", name)
         self.msg_queue.append((actor, None))
         self.actors[name] = actor
 
@@ -32,7 +32,7 @@ class ActorScheduler:
         Send a message to a named actor
         """
         if actor := self.actors.get(name):
-            self.logger.debug(f"send msg '{msg}' to actor '{actor}'")
+            self.logger.debug("send msg '%s' to actor '%s'", msg, actor)
             self.msg_queue.append((actor, msg))
 
     def run(self):
@@ -42,7 +42,22 @@ class ActorScheduler:
         while self.msg_queue:
             actor, msg = self.msg_queue.popleft()
             try:
-                self.logger.debug(f"run actor '{actor}' with msg '{msg}'")
+                self.logger.debug("run actor '%s' with msg '%s'", actor, msg)
                 actor.send(msg)
             except StopIteration:
                 self.logger.debug("stop run action in scheduler")
+
+    def step(self, name, msg=None):
+        """
+        Send one message directly to a named actor, keeping it for later steps.
+        Return False if the actor is unknown or has stopped.
+        """
+        if not (actor := self.actors.get(name)):
+            return False
+        try:
+            actor.send(msg)
+        except StopIteration:
+            self.logger.debug("actor '%s' stopped", name)
+            del self.actors[name]
+            return False
+        return True
@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+from ctypes import CDLL
+from typing import Any, Hashable, Optional
+
+
+class ContextCache(object):
+    """Bounded LRU cache of Java objects by (vmid, Accessible Context).
+
+    A cached value is a JOBJECT64 or a dict of JOBJECT64 returned by Java Access
+    Bridge. The cache owns these Java objects: they are released by
+    releaseJavaObject when their entry is replaced, evicted, popped or cleared,
+    so callers must not release a value they got from the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def _release(key: tuple, bridge: CDLL, value: Any) -> None:
+        objs = value.values() if isinstance(value, dict) else (value,)
+        for obj in objs:
+            if obj:
+                bridge.releaseJavaObject(key[0], obj)
+
+    def _release_entries(self, entries: list) -> None:
+        # released outside of the lock, releaseJavaObject is an IPC with the JVM
+        for key, (bridge, value) in entries:
+            self._release(key, bridge, value)
+
+    def get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: tuple, bridge: CDLL, value: Any) -> None:
+        with self._lock:
+            released = []
+            if (old := self._entries.pop(key, None)) is not None:
+                released.append((key, old))
+            self._entries[key] = (bridge, value)
+            while len(self._entries) > self.maxsize:
+                released.append(self._entries.popitem(last=False))
+        self._release_entries(released)
+
+    def pop(self, key: tuple) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._release_entries([(key, entry)])
+
+    def pop_vmid(self, vmid: int) -> None:
+        with self._lock:
+            released = [
+                (key, self._entries.pop(key))
+                for key in [key for key in self._entries if key[0] == vmid]
+            ]
+        self._release_entries(released)
+
+    def clear(self) -> None:
+        with self._lock:
+            released = list(self._entries.items())
+            self._entries.clear()
+        self._release_entries(released)
@@ -15,6 +15,9 @@ class Logger(object):
         self.log = logging.getLogger(name)
         logging.basicConfig(format=self.FORMAT, level=level)
 
+    def isEnabledFor(self, level):
+        return self.log.isEnabledFor(level)
+
     def info(self, msg, *args, **kwargs):
         self.log.info(msg, *args, **kwargs)
 
@@ -17,6 +17,8 @@ from pyjab.config import JRE_BRIDGE_DLL
 class Service(object):
     def __init__(self) -> None:
         self.logger = Logger("pyjab")
+        # loaded dll per path, every driver shares one CDLL with fixed functions
+        self._libraries = {}
         self.init_bridge()
 
     def enable_bridge(self) -> None:
@@ -37,7 +39,7 @@ class Service(object):
                 self.logger.error("bridge is not enabled")
                 return False
         is_enabled = data == A11Y_PROPS_CONTENT
-        self.logger.debug("is bridge enabled => '{}'".format(is_enabled))
+        self.logger.debug("is bridge enabled => '%s'", is_enabled)
         return is_enabled
 
     def init_bridge(self) -> None:
@@ -46,6 +48,21 @@ class Service(object):
             self.enable_bridge()
 
     def load_library(self, bridge_dll: str = "") -> CDLL:
+        """Load WindowsAccessBridge dll file.
+
+        The dll is loaded as CDLL instead of PyDLL, ctypes releases the GIL
+        around calls of CDLL functions, other Python threads keep running
+        while a bridge call is blocked in JVM.
+
+        Args:
+            bridge_dll (str, optional): Customized WindowsAccessBridge dll file path. Defaults to "".
+
+        Raises:
+            FileNotFoundError: WindowsAccessBridge dll file not found.
+
+        Returns:
+            CDLL: The loaded WindowsAccessBridge dll.
+        """
         self.logger.debug("load library of bridge")
         dll_bit = struct.calcsize("P") * 8
         for dll in [
@@ -54,8 +71,11 @@ class Service(object):
             JRE_BRIDGE_DLL.format(dll_bit),
             JAB_BRIDGE_DLL.format(dll_bit),
         ]:
+            if dll in self._libraries:
+                return self._libraries[dll]
             if os.path.isfile(dll):
-                return cdll.LoadLibrary(dll)
+                self._libraries[dll] = cdll.LoadLibrary(dll)
+                return self._libraries[dll]
         raise FileNotFoundError(
             "WindowsAccessBridge dll not found, "
             "please set correct path for environment variable, "
@@ -1,7 +1,8 @@
 import fnmatch
+import threading
 import time
 from ctypes.wintypes import HWND
-from typing import Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Generator, List, Optional
 import pythoncom
 import win32api
 import win32clipboard
@@ -11,7 +12,14 @@ import win32event
 import win32gui
 from pyjab.common.logger import Logger
 from pyjab.common.singleton import singleton
-from pyjab.config import TIMEOUT
+from pyjab.config import MAX_POLL_INTERVAL, POLL_INTERVAL, TIMEOUT
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+class _StopEnumWindows(Exception):
+    """Raised in an EnumWindows callback to end the enumeration early."""
 
 
 @singleton
@@ -168,52 +176,57 @@ class Win32Utils(object):
 
     def __init__(self) -> None:
         self.logger = Logger("pyjab")
+        # screen capture GDI objects, reused while the captured size is unchanged
+        self._capture = None
+        self._capture_lock = threading.Lock()
 
     def setup_msg_pump(self) -> Generator:
         waitables = self.stop_event, self.other_event
         self.logger.debug("setup message pumpup")
-        while True:
-            rc = win32event.MsgWaitForMultipleObjects(
-                waitables,
-                0,  # Wait for all = false, so it waits for anyone
-                200,  # Timeout, ms (or win32event.INFINITE)
-                win32event.QS_ALLEVENTS,  # Accepts all input
-            )
-            if rc == win32event.WAIT_OBJECT_0:
-                self.logger.debug(
-                    "first event listed, the StopEvent, was triggered, must exit"
+        # teardown only once the pump ends, the generator is resumed on every tick
+        try:
+            while True:
+                rc = win32event.MsgWaitForMultipleObjects(
+                    waitables,
+                    0,  # Wait for all = false, so it waits for anyone
+                    200,  # Timeout, ms (or win32event.INFINITE)
+                    win32event.QS_ALLEVENTS,  # Accepts all input
                 )
-                break
-            elif rc == win32event.WAIT_OBJECT_0 + 1:
-                # Our second event listed, "OtherEvent", was set. Do whatever needs
-                # to be done -- you can wait on as many kernel-waitable objects as
-                # needed (events, locks, processes, threads, notifications, and so on).
-                self.logger.debug("second event listed was set")
-            elif rc == win32event.WAIT_OBJECT_0 + len(waitables):
-                # A windows message is waiting - take care of it. (Don't ask me
-                # why a WAIT_OBJECT_MSG isn't defined < WAIT_OBJECT_0...!).
-                # This message-serving MUST be done for COM, DDE, and other
-                # Windowsy things to work properly!
-                self.logger.debug("windows message is waiting")
-                if pythoncom.PumpWaitingMessages():
-                    self.logger.debug("received a wm_quit message")
+                if rc == win32event.WAIT_OBJECT_0:
+                    self.logger.debug(
+                        "first event listed, the StopEvent, was triggered, must exit"
+                    )
                     break
-            elif rc == win32event.WAIT_TIMEOUT:
-                # Our timeout has elapsed.
-                # Do some work here (e.g, poll something you can't thread)
-                # or just feel good to be alive.
-                self.logger.debug("timeout")
-            else:
-                raise RuntimeError("unexpected win32wait return value")
-
-            # call functions here, if txtt doesn't take too long. It will
-            # be executed at least every 200ms -- possibly a lot more often,
-            # depending on the number of Windows messages received.
-            try:
+                elif rc == win32event.WAIT_OBJECT_0 + 1:
+                    # Our second event listed, "OtherEvent", was set. Do whatever
+                    # needs to be done -- you can wait on as many kernel-waitable
+                    # objects as needed (events, locks, processes, threads,
+                    # notifications, and so on).
+                    self.logger.debug("second event listed was set")
+                elif rc == win32event.WAIT_OBJECT_0 + len(waitables):
+                    # A windows message is waiting - take care of it. (Don't ask me
+                    # why a WAIT_OBJECT_MSG isn't defined < WAIT_OBJECT_0...!).
+                    # This message-serving MUST be done for COM, DDE, and other
+                    # Windowsy things to work properly!
+                    self.logger.debug("windows message is waiting")
+                    if pythoncom.PumpWaitingMessages():
+                        self.logger.debug("received a wm_quit message")
+                        break
+                elif rc == win32event.WAIT_TIMEOUT:
+                    # Our timeout has elapsed.
+                    # Do some work here (e.g, poll something you can't thread)
+                    # or just feel good to be alive.
+                    self.logger.debug("timeout")
+                else:
+                    raise RuntimeError("unexpected win32wait return value")
+
+                # call functions here, if txtt doesn't take too long. It will
+                # be executed at least every 200ms -- possibly a lot more often,
+                # depending on the number of Windows messages received.
                 yield
-            finally:
-                self.logger.debug("teardown message pumpup")
-                win32event.SetEvent(self.stop_event)
+        finally:
+            self.logger.debug("teardown message pumpup")
+            win32event.SetEvent(self.stop_event)
 
     @staticmethod
     def enum_windows() -> Dict[HWND, str]:
@@ -230,35 +243,74 @@ class Win32Utils(object):
         win32gui.EnumWindows(get_all_hwnds, 0)
         return dict_hwnd
 
+    @staticmethod
+    def find_hwnd_by_title(
+        title: str, predicate: Callable[[HWND], bool] = None
+    ) -> Optional[HWND]:
+        """Returns the first window matching title and predicate.
+
+        The enumeration stops at the first match instead of collecting every
+        top-level window first.
+
+        Args:
+            title (str): Window title, supports fnmatch pattern.
+            predicate (Callable[[HWND], bool], optional): Extra check for a title
+            matched window. Defaults to None.
+
+        Returns:
+            Optional[HWND]: HWND of window if found, otherwise return None.
+        """
+        found = []
+
+        def match_hwnd(hwnd, _):
+            if (
+                win32gui.IsWindowEnabled(hwnd)
+                and win32gui.IsWindowVisible(hwnd)
+                and fnmatch.fnmatch(win32gui.GetWindowText(hwnd), title)
+                and (predicate is None or predicate(hwnd))
+            ):
+                found.append(hwnd)
+                raise _StopEnumWindows
+
+        try:
+            win32gui.EnumWindows(match_hwnd, 0)
+        except _StopEnumWindows:
+            pass
+        return found[0] if found else None
+
     def get_hwnd_by_title(self, title: str) -> Optional[HWND]:
-        if possible_matches := self.get_hwnds_by_title(title):
-            return possible_matches[0]
-        return None
+        # stop enumerating windows at the first hit
+        return self.find_hwnd_by_title(title)
 
     def get_hwnds_by_title(self, title: str) -> List[HWND]:
-        dict_hwnd = self.enum_windows()
-        return [hwnd for hwnd, win_title in dict_hwnd.items() if fnmatch.fnmatch(win_title, title)]
+        return list(self.iter_hwnds_by_title(title))
+
+    def iter_hwnds_by_title(self, title: str) -> Generator[HWND, None, None]:
+        for hwnd, win_title in self.enum_windows().items():
+            if fnmatch.fnmatch(win_title, title):
+                yield hwnd
 
     @staticmethod
     def get_title_by_hwnd(hwnd: HWND) -> str:
         return win32api.GetWindowText(hwnd)
 
     def wait_hwnd_by_title(self, title: str, timeout: int = TIMEOUT) -> HWND:
-        latest_log = ""
-        start = time.time()
+        # title is fixed for the wait, log once with lazy formatting
+        logged = False
+        deadline = time.monotonic() + timeout
+        delay = POLL_INTERVAL
         while True:
             if hwnd := self.get_hwnd_by_title(title):
                 return hwnd
-            error_log = f"no hwnd found by win title =>'{title}'"
-            if latest_log != error_log:
-                self.logger.debug(error_log)
-                latest_log = error_log
-            current = time.time()
-            elapsed = round(current - start)
-            if elapsed >= timeout:
+            if not logged:
+                self.logger.debug("no hwnd found by win title =>'%s'", title)
+                logged = True
+            if time.monotonic() >= deadline:
                 raise TimeoutError(
                     f"no hwnd found by title '{title}' in '{timeout}' seconds"
                 )
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 1.5, MAX_POLL_INTERVAL)
 
     @staticmethod
     def _get_foreground_window() -> HWND:
@@ -295,6 +347,58 @@ class Win32Utils(object):
         left, top, _, _ = win32gui.GetWindowRect(hwnd)
         return left, top
 
+    def _get_foreground_window_rect(self, hwnd: HWND) -> tuple:
+        """Brings the window to foreground and returns its rect as left, top, width, height."""
+        self._set_window_foreground(hwnd)
+        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        return left, top, right - left, bottom - top
+
+    def _release_capture(self) -> None:
+        if self._capture is None:
+            return
+        _, screen_dc, src_dc, mem_dc, bitmap = self._capture
+        self._capture = None
+        win32gui.DeleteObject(bitmap.GetHandle())
+        mem_dc.DeleteDC()
+        src_dc.DeleteDC()
+        win32gui.ReleaseDC(0, screen_dc)
+
+    def _grab_screen(self, left: int, top: int, width: int, height: int) -> "Image.Image":
+        """Captures a screen area by BitBlt into a reused memory bitmap.
+
+        The screen DC, memory DC and bitmap are only created again when the
+        captured size changes.
+
+        Args:
+            left (int): Left of area in virtual screen coordinates.
+            top (int): Top of area in virtual screen coordinates.
+            width (int): Width of area.
+            height (int): Height of area.
+
+        Returns:
+            Image.Image: RGB image of the area.
+        """
+        # imported on first screenshot, like Pillow below
+        import win32ui
+
+        with self._capture_lock:
+            if self._capture is None or self._capture[0] != (width, height):
+                self._release_capture()
+                screen_dc = win32gui.GetDC(0)
+                src_dc = win32ui.CreateDCFromHandle(screen_dc)
+                mem_dc = src_dc.CreateCompatibleDC()
+                bitmap = win32ui.CreateBitmap()
+                bitmap.CreateCompatibleBitmap(src_dc, width, height)
+                mem_dc.SelectObject(bitmap)
+                self._capture = (width, height), screen_dc, src_dc, mem_dc, bitmap
+            _, _, src_dc, mem_dc, bitmap = self._capture
+            mem_dc.BitBlt((0, 0), (width, height), src_dc, (left, top), win32con.SRCCOPY)
+            bits = bitmap.GetBitmapBits(True)
+        # imported on first screenshot, drivers without screenshots skip Pillow
+        from PIL import Image
+
+        return Image.frombuffer("RGB", (width, height), bits, "raw", "BGRX", 0, 1)
+
     @staticmethod
     def _click_mouse(x: int, y: int, hold: int = 0, button: str = "left") -> None:
         mouse_down_act = win32con.MOUSEEVENTF_LEFTDOWN if button == "left" else win32con.MOUSEEVENTF_RIGHTDOWN
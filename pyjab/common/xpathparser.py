@@ -1,4 +1,6 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from pyjab.common.role import Role
 from pyjab.common.exceptions import XpathParserException
 from pyjab.common.logger import Logger
@@ -11,15 +13,19 @@ class XpathParser(object):
     def __init__(self) -> None:
         self.logger = Logger("pyjab")
 
+    def split_nodes(self, xpath: str) -> list:
+        return list(self._split_nodes(xpath))
+
     @staticmethod
-    def split_nodes(xpath: str) -> list:
+    @lru_cache(maxsize=256)
+    def _split_nodes(xpath: str) -> tuple:
         if not xpath.startswith("/"):
             raise XpathParserException("xpath should start with '/'")
         nodes = xpath.split("/")
         empty_count = nodes.count("")
         if empty_count not in [1, 2]:
             raise XpathParserException("incorrect '/' numbers")
-        return [node for node in nodes if node]
+        return tuple(node for node in nodes if node)
 
     @staticmethod
     def get_node_role(node: str) -> str:
@@ -59,7 +65,24 @@ class XpathParser(object):
             attributes.append(dict(name=name, value=value))
         return attributes
 
-    def get_node_information(self, node: str) -> dict:
-        node_role = self.get_node_role(node)
-        node_attributes = self.get_node_attributes(node[len(node_role):])
-        return dict(role=node_role, attributes=node_attributes)
+    def get_node_information(self, node: str) -> MappingProxyType:
+        return self._get_node_information(node)
+
+    # parsed nodes are cached by node string, the shared result is read only
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _get_node_information(cls, node: str) -> MappingProxyType:
+        node_role = cls.get_node_role(node)
+        node_attributes = cls.get_node_attributes(node[len(node_role):])
+        return MappingProxyType(
+            dict(
+                role=node_role,
+                attributes=tuple(
+                    MappingProxyType(attribute) for attribute in node_attributes
+                ),
+            )
+        )
+
+    def clear_cache(self) -> None:
+        self._split_nodes.cache_clear()
+        self._get_node_information.cache_clear()
@@ -9,6 +9,11 @@ MAX_ACTION_INFO = 256
 MAX_ACTIONS_TO_DO = 32
 MAX_VISIBLE_CHILDREN = 256
 TIMEOUT = 30
+# wait loops: first delay between attempts, backed off up to the max delay
+POLL_INTERVAL = 0.02
+MAX_POLL_INTERVAL = 0.25
+# max entries of each per Accessible Context cache of JABElement
+CONTEXT_CACHE_SIZE = 256
 
 # set JAB dll
 WAB_DLL = "WindowsAccessBridge-{}.dll"
@@ -2,17 +2,15 @@ from __future__ import annotations
 
 import os
 import signal
+from collections import deque
 from ctypes import byref
-from ctypes import CDLL
 from ctypes import c_long
 from ctypes.wintypes import HWND
 from pathlib import Path
 from subprocess import Popen
-from time import time
-from typing import Any, Dict, Tuple, Optional
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Generator, Tuple, Optional
 
-import win32process
-from PIL import ImageGrab
 from pyjab.accessibleinfo import AccessBridgeVersionInfo
 from pyjab.common.actorscheduler import ActorScheduler
 from pyjab.common.by import By
@@ -21,7 +19,7 @@ from pyjab.common.logger import Logger
 from pyjab.common.service import Service
 from pyjab.common.win32utils import Win32Utils
 from pyjab.common.types import JOBJECT64
-from pyjab.config import TIMEOUT
+from pyjab.config import MAX_POLL_INTERVAL, POLL_INTERVAL, TIMEOUT
 from pyjab.jabelement import JABElement
 from pyjab.jabfixedfunc import JABFixedFunc
 
@@ -33,6 +31,60 @@ class JABDriver(object):
         Service ([type]): Host system to initialize the JAB and load JAB dll file.
     """
 
+    # no per-instance __dict__, attributes are accessed through slots
+    __slots__ = (
+        "win32utils",
+        "file_path",
+        "_app_process",
+        "title",
+        "serv",
+        "logger",
+        "latest_log",
+        "_bridge_dll",
+        "_timeout",
+        "hwnd",
+        "vmid",
+        "pid",
+        "accessible_context",
+        "bridge",
+        "_root_element",
+        "_root_props",
+    )
+
+    # By strategy to finder method name, built once instead of per find call
+    _FIND_ONE = {
+        By.NAME: "find_element_by_name",
+        By.DESCRIPTION: "find_element_by_description",
+        By.ROLE: "find_element_by_role",
+        By.STATES: "find_element_by_states",
+        By.OBJECT_DEPTH: "find_element_by_object_depth",
+        By.CHILDREN_COUNT: "find_element_by_children_count",
+        By.INDEX_IN_PARENT: "find_element_by_index_in_parent",
+        By.XPATH: "find_element_by_xpath",
+    }
+    _FIND_MANY = {
+        By.NAME: "find_elements_by_name",
+        By.DESCRIPTION: "find_elements_by_description",
+        By.ROLE: "find_elements_by_role",
+        By.STATES: "find_elements_by_states",
+        By.OBJECT_DEPTH: "find_elements_by_object_depth",
+        By.CHILDREN_COUNT: "find_elements_by_children_count",
+        By.INDEX_IN_PARENT: "find_elements_by_index_in_parent",
+        By.XPATH: "find_elements_by_xpath",
+    }
+    # By strategy to root element property compared by iter_elements
+    _ROOT_PROPS = {
+        By.NAME: "name",
+        By.DESCRIPTION: "description",
+        By.ROLE: "role",
+        By.STATES: "states",
+        By.OBJECT_DEPTH: "object_depth",
+        By.CHILDREN_COUNT: "children_count",
+        By.INDEX_IN_PARENT: "index_in_parent",
+    }
+    # root element properties cached until refresh_root, the others are volatile
+    _STABLE_ROOT_PROPS = frozenset(("role", "object_depth", "index_in_parent"))
+
     def __init__(
             self,
             title: str = "",
@@ -58,7 +110,8 @@ class JABDriver(object):
         super(JABDriver, self).__init__()
         self.win32utils = Win32Utils()
         self.file_path = file_path
-        self._title = title
+        self._app_process = None
+        self.title = title
         if self.file_path:
             self.open_application()
         self.serv = Service()
@@ -66,75 +119,41 @@ class JABDriver(object):
         self.latest_log = None
         self._bridge_dll = bridge_dll
         self._timeout = timeout
-        self._hwnd = hwnd
-        self._vmid = vmid
-        self._pid = None
-        self._accessible_context = accessible_context
-        self._bridge = None
+        self.hwnd = hwnd
+        self.vmid = vmid
+        self.pid = None
+        self.accessible_context = accessible_context
+        self.bridge = None
         self._root_element = None
+        self._root_props = {}
         self.init_jab()
-        JABFixedFunc(self.bridge)._fix_bridge_functions()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         os.kill(self.pid, signal.SIGTERM)
+        # the launched process may be a launcher like javaws, not the window process
+        if self._app_process is not None:
+            if self._app_process.poll() is None:
+                self._app_process.terminate()
+            self._app_process.wait()
+            self._app_process = None
 
     def open_application(self):
-        cmd = " ".join(["javaws", str(self.file_path)]) if self.file_path.suffix == "jnlp" else str(self.file_path)
-        p = Popen(cmd, shell=True)
-        p.wait()
+        suffix = self.file_path.suffix.lower()
+        if suffix == ".jnlp":
+            p = Popen(["javaws", str(self.file_path)])
+        elif suffix in (".exe", ".bat", ".cmd", ".com"):
+            p = Popen([str(self.file_path)])
+        else:
+            # other files like .jar are opened by file association through the shell
+            p = Popen(str(self.file_path), shell=True)
+        # not waited here, the application starts up while the bridge is loaded
+        # and the Java window is polled by title in init_jab
+        self._app_process = p
         return p
 
-    @property
-    def title(self) -> str:
-        return self._title
-
-    @title.setter
-    def title(self, title: str) -> None:
-        self._title = title
-
-    @property
-    def hwnd(self) -> HWND:
-        return self._hwnd
-
-    @hwnd.setter
-    def hwnd(self, hwnd: HWND) -> None:
-        self._hwnd = hwnd
-
-    @property
-    def pid(self) -> int:
-        return self._pid
-
-    @pid.setter
-    def pid(self, pid: int) -> None:
-        self._pid = pid
-
-    @property
-    def vmid(self) -> c_long:
-        return self._vmid
-
-    @vmid.setter
-    def vmid(self, vmid: c_long) -> None:
-        self._vmid = vmid
-
-    @property
-    def accessible_context(self) -> JOBJECT64:
-        return self._accessible_context
-
-    @accessible_context.setter
-    def accessible_context(self, accessible_context: JOBJECT64) -> None:
-        self._accessible_context = accessible_context
-
-    @property
-    def bridge(self) -> CDLL:
-        return self._bridge
-
-    @bridge.setter
-    def bridge(self, bridge: CDLL) -> None:
-        self._bridge = bridge
-
     @property
     def root_element(self) -> JABElement:
         return self._root_element
@@ -142,18 +161,67 @@ class JABDriver(object):
     @root_element.setter
     def root_element(self, root_element: JABElement) -> None:
         self._root_element = root_element
+        self._root_props = {}
+
+    def _get_root_prop(self, name: str) -> Any:
+        """Returns a property of root element.
+
+        Only the properties which do not change while the window lives
+        (role, object depth and index in parent) are cached until refresh_root,
+        the others are read again on every call so waits on them can succeed.
+
+        Args:
+            name (str): Property name of JABElement.
+
+        Returns:
+            Any: Property value of root element.
+        """
+        if name in self._root_props:
+            return self._root_props[name]
+        if name == "object_depth":
+            value = self.root_element.object_depth
+        else:
+            info = self.root_element._get_accessible_context_info()
+            value = {
+                "name": info.name,
+                "description": info.description,
+                "role": info.role,
+                "states": info.states.split(","),
+                "children_count": info.childrenCount,
+                "index_in_parent": info.indexInParent,
+            }[name]
+        if name in self._STABLE_ROOT_PROPS:
+            self._root_props[name] = value
+        return value
+
+    def refresh_root(self) -> None:
+        """Drop the cached root element properties, e.g. after the window changed."""
+        self._root_props = {}
+
+    def register_cache_invalidation(self) -> None:
+        """Opt in to drop the cached element contexts on Java Access Bridge events.
+
+        Replaces any focus lost, property change and property child change
+        handler of the bridge, events are only delivered while this thread
+        pumps Windows messages.
+        """
+        JABElement.register_cache_invalidation(self.bridge)
 
     def _run_actor_sched(self) -> None:
-        # invoke generator in message queue
+        # tick the message pump, it is only set up again after it stopped
         sched = ActorScheduler()
-        sched.new_actor("pyjab", self.win32utils.setup_msg_pump())
-        sched.run()
+        if not sched.step("pyjab"):
+            sched.new_actor("pyjab", self.win32utils.setup_msg_pump())
+            sched.run()
 
     def init_jab(self) -> None:
         # enum window and find hwnd
         self.logger.info("init jab")
         # load AccessBridge dll file
         self.bridge = self.serv.load_library(self._bridge_dll)
+        # declare restype/argtypes before the first bridge call, so the handles
+        # passed around in init_jab are not truncated to c_int
+        JABFixedFunc(self.bridge)._fix_bridge_functions()
         self.bridge.Windows_run()
         # setup message queue for actor scheduler
         self._run_actor_sched()
@@ -221,6 +289,9 @@ class JABDriver(object):
         return accessible_context, vmid.value
 
     def get_pid_from_hwnd(self):
+        # imported on first use, only needed once per driver init
+        import win32process
+
         _, pid = win32process.GetWindowThreadProcessId(self.hwnd)
         return pid
 
@@ -252,9 +323,10 @@ class JABDriver(object):
         Returns:
             Optional[HWND]: HWND if found Java Window, otherwise return None
         """
-        for hwnd in self.win32utils.get_hwnds_by_title(title=title):
-            if self._is_java_window(hwnd):
-                return hwnd
+        # title and isJavaWindow are checked while enumerating, stop at first match
+        return self.win32utils.find_hwnd_by_title(
+            title=title, predicate=self._is_java_window
+        )
 
     def wait_java_window_by_title(self, title: str, timeout: int = TIMEOUT) -> HWND:
         """Wait until a Java Window exists in specific seconds.
@@ -269,60 +341,72 @@ class JABDriver(object):
         Returns:
             HWND of Java window found in specific seconds.
         """
-        start = time()
+        # monotonic deadline, not affected by system clock changes
+        deadline = monotonic() + timeout
+        delay = POLL_INTERVAL
+        # bound once, the loop body only reads locals
+        get_java_window_hwnd = self.get_java_window_hwnd
+        run_actor_sched = self._run_actor_sched
+        # compare a cheap key, the message is only formatted when logged
+        log_key = ("java window", title)
         while True:
-            if hwnd := self.get_java_window_hwnd(title=title):
+            if hwnd := get_java_window_hwnd(title=title):
                 return hwnd
-            log_out = f"no java window found by title '{title}'"
-            if self.latest_log != log_out:
-                self.logger.debug(log_out)
-                self.latest_log = log_out
-            current = time()
-            elapsed = round(current - start)
-            if elapsed >= timeout:
+            if self.latest_log != log_key:
+                self.logger.debug("no java window found by title '%s'", title)
+                self.latest_log = log_key
+            if monotonic() >= deadline:
                 raise TimeoutError(
                     f"no java window found by title '{title}' in '{timeout}'seconds"
                 )
-            self._run_actor_sched()
+            run_actor_sched()
+            # back off while the window is slow to appear
+            sleep(min(delay, max(deadline - monotonic(), 0)))
+            delay = min(delay * 1.5, MAX_POLL_INTERVAL)
 
     # jab driver functions: similar with webdriver
+    def _find_element_by_prop(self, prop: str, value: Any, visible: bool) -> JABElement:
+        """Shared body of find_element_by_X, checks root before searching its children."""
+        root = self.root_element
+        if value == self._get_root_prop(prop):
+            return root
+        return getattr(root, f"find_element_by_{prop}")(value=value, visible=visible)
+
+    def _find_elements_by_prop(
+            self, prop: str, value: Any, visible: bool
+    ) -> list[JABElement]:
+        """Shared body of find_elements_by_X, root is included first if it matches."""
+        root = self.root_element
+        jabelements = getattr(root, f"find_elements_by_{prop}")(
+            value=value, visible=visible
+        )
+        if value == self._get_root_prop(prop):
+            return [root, *jabelements]
+        return jabelements
+
     def find_element_by_name(self, value: str, visible: bool = False) -> JABElement:
         """
         Find an JABElement given a name locator.
         """
-        if value == self.root_element.name:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_name(value=value, visible=visible)
+        return self._find_element_by_prop("name", value, visible)
 
     def find_element_by_description(self, value: str, visible: bool = False) -> JABElement:
         """
         Find an JABElement given a description locator.
         """
-        if value == self.root_element.description:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_description(value=value, visible=visible)
+        return self._find_element_by_prop("description", value, visible)
 
     def find_element_by_role(self, value: str, visible: bool = False) -> JABElement:
         """
         Find an JABElement given a role locator.
         """
-        if value == self.root_element.role:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_role(value=value, visible=visible)
+        return self._find_element_by_prop("role", value, visible)
 
     def find_element_by_states(self, value: str, visible: bool = False) -> JABElement:
         """
         Find an JABElement given a state locator.
         """
-        if value == self.root_element.states:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_states(
-                value=value, visible=visible
-            )
+        return self._find_element_by_prop("states", value, visible)
 
     def find_element_by_object_depth(
             self, value: int, visible: bool = False
@@ -330,12 +414,7 @@ class JABDriver(object):
         """
         Find an JABElement given an object depth locator.
         """
-        if value == self.root_element.object_depth:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_object_depth(
-                value=value, visible=visible
-            )
+        return self._find_element_by_prop("object_depth", value, visible)
 
     def find_element_by_children_count(
             self, value: int, visible: bool = False
@@ -343,12 +422,7 @@ class JABDriver(object):
         """
         Find an JABElement given a children count locator.
         """
-        if value == self.root_element.children_count:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_children_count(
-                value=value, visible=visible
-            )
+        return self._find_element_by_prop("children_count", value, visible)
 
     def find_element_by_index_in_parent(
             self, value: int, visible: bool = False
@@ -356,12 +430,7 @@ class JABDriver(object):
         """
         Find an JABElement given an index in parent locator.
         """
-        if value == self.root_element.index_in_parent:
-            return self.root_element
-        else:
-            return self.root_element.find_element_by_index_in_parent(
-                value=value, visible=visible
-            )
+        return self._find_element_by_prop("index_in_parent", value, visible)
 
     def find_element_by_xpath(self, value: str, visible: bool = False) -> JABElement:
         """
@@ -369,25 +438,25 @@ class JABDriver(object):
         """
         return self.root_element.find_element_by_xpath(value=value, visible=visible)
 
+    @staticmethod
+    def clear_xpath_cache() -> None:
+        """Drop the parsed xpath nodes cached by find_element(s)_by_xpath."""
+        JABElement.xpath_parser.clear_cache()
+
     def find_element(
             self, by: str = By.NAME, value: Any = None, visible: bool = False
     ) -> JABElement:
         """
         Find an JABElement given a By strategy and locator.
         """
-        dict_find = {
-            By.NAME: self.find_element_by_name,
-            By.DESCRIPTION: self.find_element_by_description,
-            By.ROLE: self.find_element_by_role,
-            By.STATES: self.find_element_by_states,
-            By.OBJECT_DEPTH: self.find_element_by_object_depth,
-            By.CHILDREN_COUNT: self.find_element_by_children_count,
-            By.INDEX_IN_PARENT: self.find_element_by_index_in_parent,
-            By.XPATH: self.find_element_by_xpath,
-        }
-        if by not in dict_find.keys():
+        # xpath is never matched on root, hand it to root element directly
+        if by == By.XPATH:
+            return self.root_element.find_element_by_xpath(value=value, visible=visible)
+        try:
+            find_name = self._FIND_ONE[by]
+        except KeyError:
             raise JABException(f"incorrect by strategy '{by}'")
-        return dict_find[by](value=value, visible=visible)
+        return getattr(self, find_name)(value=value, visible=visible)
 
     def find_elements_by_name(
             self, value: str, visible: bool = False
@@ -395,13 +464,7 @@ class JABDriver(object):
         """
         Find list of JABElement given a name locator.
         """
-        jabelements = []
-        if value == self.root_element.name:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_name(value=value, visible=visible)
-        )
-        return jabelements
+        return self._find_elements_by_prop("name", value, visible)
 
     def find_elements_by_description(
             self, value: str, visible: bool = False
@@ -409,13 +472,7 @@ class JABDriver(object):
         """
         Find list of JABElement given a description locator.
         """
-        jabelements = []
-        if value == self.root_element.description:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_description(value=value, visible=visible)
-        )
-        return jabelements
+        return self._find_elements_by_prop("description", value, visible)
 
     def find_elements_by_role(
             self, value: str, visible: bool = False
@@ -423,13 +480,7 @@ class JABDriver(object):
         """
         Find list of JABElement given a role locator.
         """
-        jabelements = []
-        if value == self.root_element.role:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_role(value=value, visible=visible)
-        )
-        return jabelements
+        return self._find_elements_by_prop("role", value, visible)
 
     def find_elements_by_states(
             self, value: str, visible: bool = False
@@ -437,13 +488,7 @@ class JABDriver(object):
         """
         Find list of JABElement given a state locator.
         """
-        jabelements = []
-        if value == self.root_element.states:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_states(value=value, visible=visible)
-        )
-        return jabelements
+        return self._find_elements_by_prop("states", value, visible)
 
     def find_elements_by_object_depth(
             self, value: int, visible: bool = False
@@ -451,15 +496,7 @@ class JABDriver(object):
         """
         Find list of JABElement given an object depth locator.
         """
-        jabelements = []
-        if value == self.root_element.object_depth:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_object_depth(
-                value=value, visible=visible
-            )
-        )
-        return jabelements
+        return self._find_elements_by_prop("object_depth", value, visible)
 
     def find_elements_by_children_count(
             self, value: int, visible: bool = False
@@ -467,15 +504,7 @@ class JABDriver(object):
         """
         Find list of JABElement given a children count locator.
         """
-        jabelements = []
-        if value == self.root_element.children_count:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_children_count(
-                value=value, visible=visible
-            )
-        )
-        return jabelements
+        return self._find_elements_by_prop("children_count", value, visible)
 
     def find_elements_by_index_in_parent(
             self, value: int, visible: bool = False
@@ -483,15 +512,7 @@ class JABDriver(object):
         """
         Find list of JABElement given an index in parent locator.
         """
-        jabelements = []
-        if value == self.root_element.index_in_parent:
-            jabelements.append(self.root_element)
-        jabelements.extend(
-            self.root_element.find_elements_by_index_in_parent(
-                value=value, visible=visible
-            )
-        )
-        return jabelements
+        return self._find_elements_by_prop("index_in_parent", value, visible)
 
     def find_elements_by_xpath(
             self, value: str, visible: bool = False
@@ -507,19 +528,55 @@ class JABDriver(object):
         """
         Find list of JABElement given a By strategy and locator.
         """
-        dict_finds = {
-            By.NAME: self.find_elements_by_name,
-            By.DESCRIPTION: self.find_elements_by_description,
-            By.ROLE: self.find_elements_by_role,
-            By.STATES: self.find_elements_by_states,
-            By.OBJECT_DEPTH: self.find_elements_by_object_depth,
-            By.CHILDREN_COUNT: self.find_elements_by_children_count,
-            By.INDEX_IN_PARENT: self.find_elements_by_index_in_parent,
-            By.XPATH: self.find_elements_by_xpath,
-        }
-        if by not in dict_finds.keys():
+        if by == By.XPATH:
+            return self.root_element.find_elements_by_xpath(value=value, visible=visible)
+        try:
+            find_name = self._FIND_MANY[by]
+        except KeyError:
+            raise JABException(f"incorrect by strategy '{by}'")
+        return getattr(self, find_name)(value=value, visible=visible)
+
+    def find_elements_by_predicate(
+            self, predicate: Callable[[JABElement], bool], visible: bool = False
+    ) -> list[JABElement]:
+        """
+        Find list of JABElement matched by predicate, root element included.
+        The tree is walked breadth first, one level of parents after another,
+        and JABElement not matched are released once their children are fetched.
+        """
+        root = self.root_element
+        generate_childs = root._generate_childs_from_element
+        release = root.release_jabelement
+        jabelements = [root] if predicate(root) else []
+        # parents of the next level with whether they were matched
+        parents = deque([(root, True)])
+        while parents:
+            parent, matched = parents.popleft()
+            for child in generate_childs(jabelement=parent, visible=visible):
+                child_matched = predicate(child)
+                if child_matched:
+                    jabelements.append(child)
+                if child.children_count:
+                    parents.append((child, child_matched))
+                elif not child_matched:
+                    release(child)
+            if not matched:
+                release(parent)
+        return jabelements
+
+    def iter_elements(
+            self, by: str = By.NAME, value: Any = None, visible: bool = False
+    ) -> Generator[JABElement, None, None]:
+        """
+        Generate JABElement given a By strategy and locator, root element first
+        if matched. The tree is walked lazily, stop iterating to stop the walk.
+        """
+        if by not in self._FIND_MANY:
             raise JABException(f"incorrect by strategy '{by}'")
-        return dict_finds[by](value=value, visible=visible)
+        root = self.root_element
+        if by in self._ROOT_PROPS and value == self._get_root_prop(self._ROOT_PROPS[by]):
+            yield root
+        yield from root.iter_elements(by=by, value=value, visible=visible)
 
     def maximize_window(self):
         """
@@ -534,25 +591,60 @@ class JABDriver(object):
         self.win32utils._set_window_minimize(hwnd=self.root_element.hwnd)
 
     def wait_until_element_exist(
-            self, by: str = By.NAME, value: Any = None, timeout: int = TIMEOUT
+            self,
+            by: str = By.NAME,
+            value: Any = None,
+            timeout: int = TIMEOUT,
+            poll_interval: float = None,
     ) -> JABElement:
-        start = time()
+        """Wait until a JABElement exists in specific seconds.
+
+        Args:
+            by (str, optional): By strategy of locator. Defaults to By.NAME.
+            value (Any, optional): Locator value. Defaults to None.
+            timeout (int, optional): The timeout seconds. Defaults to TIMEOUT.
+            poll_interval (float, optional): Fixed seconds to sleep between attempts.
+            Defaults to None to back off from POLL_INTERVAL up to MAX_POLL_INTERVAL.
+
+        Raises:
+            JABException: JABElement not found when wait time over the specific timeout
+
+        Returns:
+            JABElement: JABElement found in specific seconds.
+        """
+        # monotonic deadline, not affected by system clock changes
+        deadline = monotonic() + timeout
+        delay = poll_interval or POLL_INTERVAL
+        attempts = 0
+        # checked once, the attempts log is skipped entirely when debug is off
+        debug = self.logger.isEnabledFor(Logger.LOGGER_DEBUG)
+        # bound once, the loop body only reads locals
+        find_element = self.find_element
+        log_key = ("element", by, value)
+        # the first attempt is made even with timeout 0, the deadline is checked after it
         while True:
-            current = time()
-            elapsed = round(current - start)
-            remain = round(timeout - elapsed)
-            self.logger.debug(f"elapsed => {elapsed}, remain => {remain}")
-            if elapsed >= timeout:
-                raise JABException(
-                    f"JABElement with locator '{by}' '{value}' does not found in {timeout} seconds"
+            if debug and not attempts & 15:
+                self.logger.debug(
+                    "attempts => %s, remain => %s", attempts, deadline - monotonic()
                 )
+            attempts += 1
             try:
-                return self.find_element(by=by, value=value)
+                return find_element(by=by, value=value)
             except JABException:
-                log_out = f"JABElement with locator '{by}' '{value}' does not found"
-                if self.latest_log != log_out:
-                    self.logger.warning(log_out)
-                    self.latest_log = log_out
+                if self.latest_log != log_key:
+                    self.logger.warning(
+                        "JABElement with locator '%s' '%s' does not found", by, value
+                    )
+                    self.latest_log = log_key
+            remain = deadline - monotonic()
+            if remain <= 0:
+                break
+            sleep(min(delay, remain))
+            if poll_interval is None:
+                delay = min(delay * 1.5, MAX_POLL_INTERVAL)
+        raise JABException(
+            f"JABElement with locator '{by}' '{value}' does not found in {timeout} seconds"
+        )
 
     def get_screenshot_as_file(self, filename):
         """
@@ -578,22 +670,11 @@ class JABDriver(object):
         :Usage:
             driver.get_screenshot_as_base64()
         """
-        self.win32utils._set_window_foreground(hwnd=self.root_element.hwnd)
-        bounds = self.root_element.bounds
-        x = bounds.get("x")
-        y = bounds.get("y")
-        width = bounds.get("width")
-        height = bounds.get("height")
-        return ImageGrab.grab(
-            bbox=(
-                x,
-                y,
-                x + width,
-                y + height,
-            ),
-            include_layered_windows=False,
-            all_screens=True,
+        # window rect from Win32 directly, no Accessible Context Info read needed
+        x, y, width, height = self.win32utils._get_foreground_window_rect(
+            hwnd=self.root_element.hwnd
         )
+        return self.win32utils._grab_screen(x, y, width, height)
 
     def set_window_size(self, width, height):
         """
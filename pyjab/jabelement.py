@@ -1,21 +1,42 @@
 from __future__ import annotations
 
-from time import time
+import threading
+from time import monotonic, sleep
 
 from pyjab.common.logger import Logger
 from pyjab.common.role import Role
 from pyjab.common.states import States
 from pyjab.common.textreader import TextReader
 import re
-from ctypes import Array, byref, CDLL, c_char, c_long, create_string_buffer
+from operator import itemgetter
+from ctypes import (
+    Array,
+    byref,
+    CDLL,
+    c_char,
+    c_long,
+    create_string_buffer,
+    create_unicode_buffer,
+    memset,
+)
 from ctypes.wintypes import HWND
-from typing import Any, Generator, Optional, Union
-from PIL import Image, ImageGrab
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Optional, Union
 from pyjab.common.by import By
+from pyjab.common.contextcache import ContextCache
 from pyjab.common.exceptions import JABException
 from pyjab.common.types import jint, JOBJECT64
 from pyjab.common.win32utils import Win32Utils
 from pyjab.common.xpathparser import XpathParser
+from pyjab.config import (
+    CONTEXT_CACHE_SIZE,
+    POLL_INTERVAL,
+    SHORT_STRING_SIZE,
+)
+from pyjab.apicallbacks import (
+    focus_lost_fp,
+    property_change_fp,
+    property_child_change_fp,
+)
 from pyjab.accessibleinfo import (
     AccessibleActions,
     AccessibleActionsToDo,
@@ -23,14 +44,42 @@ from pyjab.accessibleinfo import (
     AccessibleTableCellInfo,
     AccessibleTableInfo,
     AccessibleTextInfo,
+    VisibleChildren,
     VisibleChildrenInfo,
 )
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+_get_bbox_fields = itemgetter("x", "y", "width", "height")
+
 
 class JABElement(object):
+    """A component of Java window accessed by Java Access Bridge.
+
+    Threading:
+        The bridge dll is loaded as ``ctypes.CDLL`` by ``Service.load_library``,
+        so the GIL is released for the whole duration of every bridge call,
+        other Python threads keep running while a call blocks on IPC with the JVM.
+        The bridge itself is not known to be thread safe and its replies are
+        delivered by the message pump of the thread which loaded it, so pyjab
+        makes all bridge calls of a driver from that thread.
+    """
+
+    __slots__ = ("_bridge", "_hwnd", "_vmid", "_vmid_c", "_accessible_context")
+
+    logger = Logger("pyjab")
     int_func_err_msg = "Java Access Bridge func '{}' error"
     win32_utils = Win32Utils()
     xpath_parser = XpathParser()
+    # per thread buffers reused by bridge calls
+    _tls = threading.local()
+    # role to nearest ancestor Accessible Context, by (vmid, Accessible Context)
+    _ancestry_cache = ContextCache(CONTEXT_CACHE_SIZE)
+    # top level object, by (vmid, Accessible Context)
+    _top_level_object_cache = ContextCache(CONTEXT_CACHE_SIZE)
+    # registered invalidation callbacks, kept alive while the bridge may call them
+    _cache_callbacks = None
 
     def __init__(
             self,
@@ -39,13 +88,19 @@ class JABElement(object):
             vmid: c_long = None,
             accessible_context: JOBJECT64 = None,
     ) -> None:
-        self.logger = Logger("pyjab")
         self._bridge = bridge
         # jab context attributes
         self._hwnd = hwnd
         self._vmid = vmid
+        self._vmid_c = self._as_c_long(vmid)
         self._accessible_context = accessible_context
-        self._acc_info = self._get_accessible_context_info
+
+    @staticmethod
+    def _as_c_long(vmid: Union[int, c_long, None]) -> Optional[c_long]:
+        # pre-typed vmid passed to the hot bridge calls, skips conversion per call
+        if vmid is None or isinstance(vmid, c_long):
+            return vmid
+        return c_long(vmid)
 
     @property
     def bridge(self) -> CDLL:
@@ -70,6 +125,7 @@ class JABElement(object):
     @vmid.setter
     def vmid(self, vmid: c_long) -> None:
         self._vmid = vmid
+        self._vmid_c = self._as_c_long(vmid)
 
     @property
     def accessible_context(self) -> JOBJECT64:
@@ -117,11 +173,12 @@ class JABElement(object):
 
     @property
     def bounds(self) -> dict:
+        info = self._acc_info()
         return {
-            "x": self._acc_info().x,
-            "y": self._acc_info().y,
-            "height": self._acc_info().height,
-            "width": self._acc_info().width,
+            "x": info.x,
+            "y": info.y,
+            "height": info.height,
+            "width": info.width,
         }
 
     @property
@@ -152,7 +209,7 @@ class JABElement(object):
             chars_start = 0
             chars_end = txt_info.charCount - 1
             chars_len = chars_end + 1 - chars_start
-            buffer = create_string_buffer((chars_len + 1) * 2)
+            buffer = self._get_text_buffer((chars_len + 1) * 2)
             self._get_accessible_text_range(chars_start, chars_end, buffer, chars_len)
             return TextReader().get_text_from_raw_bytes(
                 buffer=buffer, chars_len=chars_len, encoding="utf_16"
@@ -160,6 +217,11 @@ class JABElement(object):
         else:
             self.logger.warning("current JABElement does not support Accessible Text")
 
+    @property
+    def value_range(self) -> dict:
+        current, minimum, maximum = self._get_accessible_value_range()
+        return {"current": current, "minimum": minimum, "maximum": maximum}
+
     @property
     def table(self) -> dict:
         if self.role_en_us == Role.TABLE:
@@ -235,16 +297,14 @@ class JABElement(object):
         )
 
         if visible:
-            children_count = self._get_visible_children_count(
-                jabelement.accessible_context
-            )
+            # returned children count comes with the children, no extra count call
             info = self._get_visible_children(jabelement.accessible_context)
-            for index in range(children_count):
+            for child_acc in info.children:
                 yield JABElement(
                     jabelement.bridge,
                     jabelement.hwnd,
                     jabelement.vmid,
-                    info.children[index],
+                    child_acc,
                 )
         else:
             for index in range(jabelement.children_count):
@@ -255,7 +315,118 @@ class JABElement(object):
                     jabelement.bridge, jabelement.hwnd, jabelement.vmid, child_acc
                 )
 
+    def walk_all_childs(self, visible: bool = False) -> list[JABElement]:
+        """walk all child jab elements depth first on the calling thread.
+
+        Java Access Bridge is not known to be thread safe and its replies are
+        delivered by the message pump of the thread which loaded it, so the walk
+        does not spread bridge calls over other threads.
+        The context info of every child is fetched once and its childrenCount
+        is reused when its own children are walked, no extra count call per parent.
+
+        Args:
+            visible (bool, optional): The switch for find only visible child jab elements or not.
+            Defaults to False to find all child elements.
+
+        Returns:
+            list[JABElement]: All child jab elements, release them when finished with them.
+        """
+        bridge, hwnd, vmid = self.bridge, self.hwnd, self.vmid
+        # bind the per-node lookups once, they run for every walked element
+        get_info = self._get_accessible_context_info
+        get_child = bridge.getAccessibleChildFromContext
+        get_visible_children = self._get_visible_children
+        jabelements = []
+        add_jabelement = jabelements.append
+        subtrees = [(self.accessible_context, self.children_count)]
+        add_subtree = subtrees.append
+        pop_subtree = subtrees.pop
+        while subtrees:
+            parent_acc, children_count = pop_subtree()
+            if visible:
+                child_accs = get_visible_children(parent_acc).children
+            else:
+                child_accs = (
+                    get_child(vmid, parent_acc, index) for index in range(children_count)
+                )
+            for child_acc in child_accs:
+                # a child removed since its parent was read comes back null
+                if not child_acc:
+                    continue
+                add_jabelement(JABElement(bridge, hwnd, vmid, child_acc))
+                count = get_info(child_acc).childrenCount
+                if count:
+                    add_subtree((child_acc, count))
+        return jabelements
+
     # JAB apis
+    @classmethod
+    def _invalidate_context(cls, vmid: c_long, accessible_context: JOBJECT64) -> None:
+        """Drop the cached entries of an Accessible Context."""
+        key = (
+            getattr(vmid, "value", vmid),
+            getattr(accessible_context, "value", accessible_context),
+        )
+        cls._top_level_object_cache.pop(key)
+        cls._ancestry_cache.pop(key)
+
+    @classmethod
+    def _invalidate_vmid(cls, vmid: c_long) -> None:
+        """Drop the cached entries of all Accessible Context in a Java VM."""
+        vmid = getattr(vmid, "value", vmid)
+        cls._top_level_object_cache.pop_vmid(vmid)
+        cls._ancestry_cache.pop_vmid(vmid)
+
+    @classmethod
+    def invalidate_all(cls) -> None:
+        """Drop all cached top level objects and ancestries, e.g. after a window reload."""
+        cls._top_level_object_cache.clear()
+        cls._ancestry_cache.clear()
+
+    @classmethod
+    def register_cache_invalidation(cls, bridge: CDLL) -> None:
+        """Register Java Access Bridge event callbacks which keep the caches coherent.
+
+        Opt-in: the callbacks replace any handler set with setPropertyChangeFP,
+        setPropertyChildChangeFP or setFocusLostFP, every event of the Java VM
+        is sent to this process, and events are only delivered while the
+        registering thread pumps Windows messages.
+
+        A property change drops the entries of its source. A child change or a
+        focus lost may change the ancestry of any Accessible Context, and the
+        event handles are new references that never equal the cached ones, so
+        all entries of the Java VM are dropped.
+
+        Args:
+            bridge (CDLL): Java Access Bridge with fixed bridge functions.
+        """
+
+        def on_property_change(vmid, event, source, property_name, old_value, new_value):
+            cls._invalidate_context(vmid, source)
+            bridge.releaseJavaObject(vmid, event)
+            bridge.releaseJavaObject(vmid, source)
+
+        def on_property_child_change(vmid, event, source, old_child, new_child):
+            cls._invalidate_vmid(vmid)
+            for obj in (event, source, old_child, new_child):
+                if obj:
+                    bridge.releaseJavaObject(vmid, obj)
+
+        def on_focus_lost(vmid, event, source):
+            cls._invalidate_vmid(vmid)
+            bridge.releaseJavaObject(vmid, event)
+            bridge.releaseJavaObject(vmid, source)
+
+        callbacks = (
+            property_change_fp(on_property_change),
+            property_child_change_fp(on_property_child_change),
+            focus_lost_fp(on_focus_lost),
+        )
+        bridge.setPropertyChangeFP(callbacks[0])
+        bridge.setPropertyChildChangeFP(callbacks[1])
+        bridge.setFocusLostFP(callbacks[2])
+        cls._cache_callbacks = callbacks
+
     def release_jabelement(self, jabelement: JABElement = None) -> None:
         """Release the memory used by the Java object object,
         where object is an object returned to you by Java Access Bridge.
@@ -270,14 +441,16 @@ class JABElement(object):
             jabelement (JABElement): The JABElement need to release
         """
         accessible_context = (
-            jabelement.accessible_context if jabelement else self.accessible_context
+            jabelement._accessible_context if jabelement else self._accessible_context
         )
-        self.bridge.releaseJavaObject(self.vmid, accessible_context)
+        # the handle may be reused by the JVM, do not serve its cached entries again
+        self._invalidate_context(self._vmid_c, accessible_context)
+        self._bridge.releaseJavaObject(self._vmid_c, accessible_context)
 
-    def _request_focus(self, accessible_context: JOBJECT64 = None) -> None:
+    def _request_focus(self, accessible_context: JOBJECT64 = None) -> bool:
         """Request focus for a component. Returns whether successful."""
         accessible_context = accessible_context or self.accessible_context
-        self.bridge.requestFocus(self.vmid, accessible_context)
+        return bool(self.bridge.requestFocus(self.vmid, accessible_context))
 
     def _get_accessible_selection_from_context(
             self, accessible_context: JOBJECT64 = None
@@ -301,9 +474,94 @@ class JABElement(object):
         accessible_context = accessible_context or self.accessible_context
         self.bridge.clearAccessibleSelectionFromContext(self.vmid, accessible_context)
 
+    def _remove_accessible_selection_from_context(
+            self, index: int, accessible_context: JOBJECT64 = None
+    ) -> None:
+        accessible_context = accessible_context or self.accessible_context
+        self.bridge.removeAccessibleSelectionFromContext(
+            self.vmid, accessible_context, index
+        )
+
+    def _get_accessible_selection_count_from_context(
+            self, accessible_context: JOBJECT64 = None
+    ) -> int:
+        accessible_context = accessible_context or self.accessible_context
+        return self.bridge.getAccessibleSelectionCountFromContext(
+            self.vmid, accessible_context
+        )
+
+    def _get_selected_indexes(self, accessible_context: JOBJECT64 = None) -> set[int]:
+        """Returns the index in parent of every selected child.
+
+        Args:
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+
+        Returns:
+            set[int]: Index in parent of selected children.
+        """
+        accessible_context = accessible_context or self.accessible_context
+        vmid = self.vmid
+        get_selection = self.bridge.getAccessibleSelectionFromContext
+        release = self.bridge.releaseJavaObject
+        get_info = self._get_accessible_context_info
+        indexes = set()
+        for index in range(
+                self._get_accessible_selection_count_from_context(accessible_context)
+        ):
+            selected_acc = get_selection(vmid, accessible_context, index)
+            indexes.add(get_info(selected_acc).indexInParent)
+            release(vmid, selected_acc)
+        return indexes
+
+    def _get_selection_mask(
+            self, count: int, accessible_context: JOBJECT64 = None
+    ) -> list[bool]:
+        """Returns whether each of the first count children is selected.
+
+        Args:
+            count (int): Count of children to check.
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+
+        Returns:
+            list[bool]: Selected state by index in parent.
+        """
+        accessible_context = accessible_context or self.accessible_context
+        vmid = self.vmid
+        is_selected = self.bridge.isAccessibleChildSelectedFromContext
+        return [bool(is_selected(vmid, accessible_context, index)) for index in range(count)]
+
+    def _set_accessible_selection_from_context(
+            self, indexes: Iterable[int], accessible_context: JOBJECT64 = None
+    ) -> None:
+        """Set the selected children to indexes with the least add and remove calls.
+
+        The current selection is read once and only the difference is applied,
+        the selection is cleared first if that needs fewer calls.
+
+        Args:
+            indexes (Iterable[int]): Index in parent of children to select.
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+        """
+        accessible_context = accessible_context or self.accessible_context
+        target = set(indexes)
+        current = self._get_selected_indexes(accessible_context)
+        to_add = target - current
+        to_remove = current - target
+        if 1 + len(target) < len(to_add) + len(to_remove):
+            self._clear_accessible_selection_from_context(accessible_context)
+            to_add, to_remove = target, set()
+        for index in to_remove:
+            self._remove_accessible_selection_from_context(index, accessible_context)
+        for index in to_add:
+            self._add_accessible_selection_from_context(index, accessible_context)
+
     def _is_same_object(self, obj1: JOBJECT64, obj2: JOBJECT64) -> bool:
         """Returns whether two object references are for the same object.
 
+        Equal handles always refer to the same object while the handles are alive,
+        so they are answered without a bridge call. Only different handles are
+        checked by the bridge, as they still may refer to the same object.
+
         Args:
             obj1 (JOBJECT64): Object 1.
             obj2 (JOBJECT64): Object 2.
@@ -311,12 +569,16 @@ class JABElement(object):
         Returns:
             bool: Rerturns whether two object is same or not.
         """
-        return bool(self.bridge.isSameObject(self.vmid, obj1, obj2))
+        if getattr(obj1, "value", obj1) == getattr(obj2, "value", obj2):
+            return True
+        # hot path, skip the property descriptors
+        return bool(self._bridge.isSameObject(self._vmid_c, obj1, obj2))
 
     def _get_top_level_object(self, accessible_context: JOBJECT64 = None) -> JOBJECT64:
         """Returns the AccessibleContext for the top level object in a Java window.
         This is same AccessibleContext that is obtained from GetAccessibleContextFromHWND for that window.
         Returns (AccessibleContext)0 on error.
+        The returned object is owned by the caller.
 
         Args:
             accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
@@ -328,9 +590,30 @@ class JABElement(object):
             JOBJECT64: Top level object.
         """
         accessible_context = accessible_context or self.accessible_context
-        top_object = self.bridge.getTopLevelObject(self.vmid, accessible_context)
-        if top_object == 0:
-            raise JABException(self.int_func_err_msg.format("getTopLevelObject"))
+        return self.bridge.getTopLevelObject(self.vmid, accessible_context)
+
+    def _get_cached_top_level_object(self, accessible_context: JOBJECT64 = None) -> JOBJECT64:
+        """Returns the top level object like _get_top_level_object, cached by Accessible Context.
+
+        The returned object is owned by the cache and released when its entry is
+        evicted, so callers must neither release it nor wrap it in a JABElement.
+
+        Args:
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+
+        Raises:
+            JABException: Get top level object error.
+
+        Returns:
+            JOBJECT64: Top level object.
+        """
+        accessible_context = accessible_context or self.accessible_context
+        key = self._get_context_key(accessible_context)
+        top_object = self._top_level_object_cache.get(key)
+        if top_object is not None:
+            return top_object
+        top_object = self._get_top_level_object(accessible_context)
+        self._top_level_object_cache.put(key, self._bridge, top_object)
         return top_object
 
     def _get_accessible_parent_from_context(
@@ -347,6 +630,75 @@ class JABElement(object):
         accessible_context = accessible_context or self.accessible_context
         return self.bridge.getAccessibleParentFromContext(self.vmid, accessible_context)
 
+    def _get_context_key(self, accessible_context: JOBJECT64 = None) -> tuple[int, int]:
+        """Returns the hashable (vmid, Accessible Context) key for caches."""
+        accessible_context = accessible_context or self.accessible_context
+        return (
+            getattr(self.vmid, "value", self.vmid),
+            getattr(accessible_context, "value", accessible_context),
+        )
+
+    def _build_ancestry(self, accessible_context: JOBJECT64 = None) -> dict[str, JOBJECT64]:
+        """Walks up the parents once and maps every role to its nearest ancestor.
+
+        Parents farther than the nearest one of their role are released right away,
+        the returned Accessible Contexts are owned by the caller.
+
+        Args:
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+
+        Returns:
+            dict[str, JOBJECT64]: Dict of role_en_US and nearest ancestor Accessible Context.
+        """
+        accessible_context = accessible_context or self.accessible_context
+        ancestry = {}
+        # a parent not kept in the ancestry is only needed to step to its own parent
+        acc, kept = accessible_context, True
+        for _ in range(self._get_object_depth(accessible_context)):
+            parent_acc = self._get_accessible_parent_from_context(acc)
+            if not kept:
+                self._bridge.releaseJavaObject(self._vmid_c, acc)
+                kept = True
+            if not parent_acc:
+                break
+            role = self._get_accessible_context_info(parent_acc).role_en_US
+            kept = role not in ancestry
+            if kept:
+                ancestry[role] = parent_acc
+            acc = parent_acc
+        if not kept:
+            self._bridge.releaseJavaObject(self._vmid_c, acc)
+        return ancestry
+
+    def _get_parent_with_role(
+            self, role: str, accessible_context: JOBJECT64 = None, use_cache: bool = False
+    ) -> JOBJECT64:
+        """Returns the nearest ancestor Accessible Context with the role.
+
+        By default this is a single getParentWithRole call and the returned
+        Accessible Context is owned by the caller.
+
+        Args:
+            role (str): Role of ancestor.
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+            use_cache (bool, optional): Look up the cached ancestry instead, the parents are
+            walked only once per Accessible Context, which pays off for repeated lookups of
+            different roles. The returned Accessible Context is owned by the cache and must
+            not be released. Defaults to False.
+
+        Returns:
+            JOBJECT64: Ancestor Accessible Context, (AccessibleContext)0 if not found.
+        """
+        accessible_context = accessible_context or self.accessible_context
+        if not use_cache:
+            return self.bridge.getParentWithRole(self.vmid, accessible_context, role)
+        key = self._get_context_key(accessible_context)
+        ancestry = self._ancestry_cache.get(key)
+        if ancestry is None:
+            ancestry = self._build_ancestry(accessible_context)
+            self._ancestry_cache.put(key, self._bridge, ancestry)
+        return ancestry.get(role, JOBJECT64())
+
     def _get_accessible_context_info(
             self, accessible_context: JOBJECT64 = None
     ) -> AccessibleContextInfo:
@@ -363,13 +715,13 @@ class JABElement(object):
         """
         info = AccessibleContextInfo()
         accessible_context = accessible_context or self.accessible_context
-        result = self.bridge.getAccessibleContextInfo(
-            self.vmid, accessible_context, byref(info)
+        self._bridge.getAccessibleContextInfo(
+            self._vmid_c, accessible_context, byref(info)
         )
-        if result == 0:
-            raise JABException(self.int_func_err_msg.format("GetAccessibleContextInfo"))
         return info
 
+    _acc_info = _get_accessible_context_info
+
     def _get_object_depth(self, accessible_context: JOBJECT64 = None) -> int:
         """Returns how deep in the object hierarchy a given object is.
         The top most object in the object hierarchy has an object depth of 0.
@@ -395,11 +747,9 @@ class JABElement(object):
     ) -> AccessibleTextInfo:
         info = AccessibleTextInfo()
         accessible_context = accessible_context or self.accessible_context
-        result = self.bridge.getAccessibleTextInfo(
+        self.bridge.getAccessibleTextInfo(
             self.vmid, accessible_context, byref(info), 0, 0
         )
-        if not result:
-            raise JABException(self.int_func_err_msg.format("getAccessibleTextInfo"))
         return info
 
     def _get_accessible_text_range(
@@ -411,11 +761,9 @@ class JABElement(object):
             accessible_context: JOBJECT64 = None,
     ) -> None:
         accessible_context = accessible_context or self.accessible_context
-        result = self.bridge.getAccessibleTextRange(
+        self.bridge.getAccessibleTextRange(
             self.vmid, accessible_context, start, end, text, length
         )
-        if not result:
-            raise JABException(self.int_func_err_msg.format("getAccessibleTextRange"))
 
     def _get_accessible_table_info(
             self, accessible_context: JOBJECT64 = None
@@ -541,13 +889,9 @@ class JABElement(object):
         """
         info = AccessibleTableCellInfo()
         accessible_context = accessible_context or self.accessible_context
-        result = self.bridge.getAccessibleTableCellInfo(
+        self.bridge.getAccessibleTableCellInfo(
             self.vmid, accessible_context, row, column, byref(info)
         )
-        if not result:
-            raise JABException(
-                self.int_func_err_msg.format("getAccessibleTableCellInfo")
-            )
         return info
 
     def _get_visible_children_count(self, accessible_context: JOBJECT64 = None) -> int:
@@ -567,15 +911,86 @@ class JABElement(object):
 
     def _get_visible_children(
             self, accessible_context: JOBJECT64 = None
-    ) -> VisibleChildrenInfo:
-        info = VisibleChildrenInfo()
+    ) -> VisibleChildren:
+        """Returns the visible children of a component.
+
+        The VisibleChildrenInfo buffer is reused per thread, only the returned
+        children are copied out of it.
+
+        Args:
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+
+        Raises:
+            JABException: Get Visible Children error.
+
+        Returns:
+            VisibleChildren: Returned children count and tuple of children Accessible Context.
+        """
+        info = getattr(self._tls, "visible_children_info", None)
+        if info is None:
+            info = self._tls.visible_children_info = VisibleChildrenInfo()
         accessible_context = accessible_context or self.accessible_context
-        result = self.bridge.getVisibleChildren(
-            self.vmid, accessible_context, 0, byref(info)
-        )
-        if not result:
-            raise JABException(self.int_func_err_msg.format("getVisibleChildren"))
-        return info
+        self.bridge.getVisibleChildren(self.vmid, accessible_context, 0, byref(info))
+        count = info.returnedChildrenCount
+        # copy the children, items of the buffer array share its memory
+        children = (JOBJECT64 * count).from_buffer_copy(info.children)
+        return VisibleChildren(count, tuple(children))
+
+    def _get_text_buffer(self, size: int) -> Array:
+        """Returns the per thread text buffer with at least size bytes.
+
+        The buffer only grows, in powers of two, and the first size bytes are zeroed
+        so nothing left from a previous read is returned.
+
+        Args:
+            size (int): Bytes needed.
+
+        Returns:
+            Array: Char buffer.
+        """
+        buffer = getattr(self._tls, "text_buffer", None)
+        if buffer is None or len(buffer) < size:
+            buffer = self._tls.text_buffer = create_string_buffer(
+                max(1 << (size - 1).bit_length(), SHORT_STRING_SIZE)
+            )
+        else:
+            memset(buffer, 0, size)
+        return buffer
+
+    def _get_accessible_value_range(
+            self, accessible_context: JOBJECT64 = None
+    ) -> tuple[str, str, str]:
+        """Get current, minimum and maximum Accessible Value back to back.
+
+        The three bridge calls share one per-thread buffer, each value is copied
+        out before the next call overwrites it.
+
+        Args:
+            accessible_context (JOBJECT64, optional): Accessible Context. Defaults to None.
+
+        Raises:
+            JABException: Get Accessible Value error.
+
+        Returns:
+            tuple[str, str, str]: Current, minimum and maximum Accessible Value.
+        """
+        buffer = getattr(self._tls, "value_buffer", None)
+        if buffer is None:
+            buffer = self._tls.value_buffer = create_unicode_buffer(SHORT_STRING_SIZE)
+        accessible_context = accessible_context or self.accessible_context
+        vmid = self.vmid
+        bridge = self.bridge
+        values = []
+        for func_name in (
+            "getCurrentAccessibleValueFromContext",
+            "getMinimumAccessibleValueFromContext",
+            "getMaximumAccessibleValueFromContext",
+        ):
+            getattr(bridge, func_name)(
+                vmid, accessible_context, buffer, SHORT_STRING_SIZE
+            )
+            values.append(buffer.value)
+        return tuple(values)
 
     def _do_accessible_action(self, action: str = None) -> None:
         """Do Accessible Action with current JABElement.
@@ -633,10 +1048,11 @@ class JABElement(object):
         """
         if simulate:
             self.win32_utils._set_window_foreground(hwnd=self.hwnd)
-            x = self.bounds.get("x")
-            y = self.bounds.get("y")
-            width = self.bounds.get("width")
-            height = self.bounds.get("height")
+            bounds = self.bounds
+            x = bounds.get("x")
+            y = bounds.get("y")
+            width = bounds.get("width")
+            height = bounds.get("height")
             if width == 0 or height == 0:
                 raise ValueError("element width or height is 0")
             position_x = round(x + width / 2)
@@ -672,7 +1088,7 @@ class JABElement(object):
             self.send_text(value="", simulate=False)
         if not wait_for_text_update or self.role != Role.TEXT:
             return
-        self._wait_for_value_to_be(None, self.text, error_msg_function="clear text")
+        self._wait_for_value_to_be(None, lambda: self.text, error_msg_function="clear text")
 
     def scroll(self, to_bottom: bool = True, hold: int = 2) -> None:
         """Scroll a scoll bar to top or to bottom.
@@ -689,10 +1105,11 @@ class JABElement(object):
         if self.role_en_us != Role.SCROLL_BAR:
             raise JABException("JABElement is not 'scroll bar'")
         is_horizontal = "horizontal" in self.states_en_us
-        x = self.bounds["x"]
-        y = self.bounds["y"]
-        height = self.bounds["height"]
-        width = self.bounds["width"]
+        bounds = self.bounds
+        x = bounds["x"]
+        y = bounds["y"]
+        height = bounds["height"]
+        width = bounds["width"]
         self.win32_utils._set_window_foreground(hwnd=self.hwnd)
         # horizontal scroll to bottom(right)
         if to_bottom and is_horizontal:
@@ -724,10 +1141,11 @@ class JABElement(object):
         if self.role_en_us != "slider":
             raise JABException("JABElement is not 'slider'")
         is_horizontal = "horizontal" in self.states_en_us
-        x = self.bounds["x"]
-        y = self.bounds["y"]
-        height = self.bounds["height"]
-        width = self.bounds["width"]
+        bounds = self.bounds
+        x = bounds["x"]
+        y = bounds["y"]
+        height = bounds["height"]
+        width = bounds["width"]
         self.win32_utils._set_window_foreground(hwnd=self.hwnd)
         # horizontal slide to bottom(right)
         if to_bottom and is_horizontal:
@@ -758,8 +1176,9 @@ class JABElement(object):
             "menu": self._select_from_menu,
         }[self.role_en_us](option=option, simulate=simulate)
         if wait_for_selection:
+            option_element = self.find_element_by_name(option)
             self._wait_for_value_to_contain([States.SELECTED, States.CHECKED],
-                                            self.find_element_by_name(option).states_en_us)
+                                            lambda: option_element.states_en_us)
 
     def get_selected_element(self) -> JABElement:
         """Get selected JABElement from selection.
@@ -778,6 +1197,43 @@ class JABElement(object):
             accessible_context=selected_acc,
         )
 
+    def select_indexes(self, indexes: Iterable[int]) -> None:
+        """Set the selected children of JABElement selector by index in parent.
+
+        Only the changed children are added or removed, selecting the current
+        selection again does not change anything.
+
+        Args:
+            indexes (Iterable[int]): Index in parent of children to select.
+
+        Raises:
+            JABException: Raise JABException if JABElement does not support Accessible Selection.
+            ValueError: Raise ValueError if an index is not an index of a child.
+        """
+        info = self._acc_info()
+        if not info.accessibleSelection:
+            raise JABException("JABElement does not support Accessible Selection")
+        indexes = set(indexes)
+        if any(not 0 <= index < info.childrenCount for index in indexes):
+            raise ValueError(
+                f"indexes {sorted(indexes)} out of range of {info.childrenCount} children"
+            )
+        self._set_accessible_selection_from_context(indexes)
+
+    def get_selection_mask(self) -> list[bool]:
+        """Get the selected state of every child of JABElement selector.
+
+        Returns:
+            list[bool]: Selected state by index in parent.
+
+        Raises:
+            JABException: Raise JABException if JABElement does not support Accessible Selection.
+        """
+        info = self._acc_info()
+        if not info.accessibleSelection:
+            raise JABException("JABElement does not support Accessible Selection")
+        return self._get_selection_mask(info.childrenCount)
+
     def _add_selection_from_accessible_context(
             self, parent: JABElement, option: str
     ) -> None:
@@ -870,10 +1326,11 @@ class JABElement(object):
             action = "decrement"
             offset_y_position = 5
         if simulate:
-            x = self.bounds["x"]
-            y = self.bounds["y"]
-            height = self.bounds["height"]
-            width = self.bounds["width"]
+            bounds = self.bounds
+            x = bounds["x"]
+            y = bounds["y"]
+            height = bounds["height"]
+            width = bounds["width"]
             self.win32_utils._set_window_foreground(hwnd=self.hwnd)
             x = x + width - 5
             y = y + height / 2 + offset_y_position
@@ -922,7 +1379,7 @@ class JABElement(object):
                 )
         if not wait_for_text_update or self.role != Role.TEXT:
             return
-        self._wait_for_value_to_be(value, self.text, error_msg_function=f"update text attribute to '{value}'")
+        self._wait_for_value_to_be(value, lambda: self.text, error_msg_function=f"update text attribute to '{value}'")
 
     def is_checked(self) -> bool:
         """Returns whether the JABElement is checked.
@@ -1219,7 +1676,8 @@ class JABElement(object):
         )
         if not is_same:
             return jabelement
-        top_object = self._get_top_level_object(self.accessible_context)
+        # only compared, never released or wrapped, so the cache may own it
+        top_object = self._get_cached_top_level_object(self.accessible_context)
         is_top_level = self._is_same_object(self.accessible_context, top_object)
         return jabelement if is_top_level else self.parent
 
@@ -1562,18 +2020,55 @@ class JABElement(object):
             raise JABException(f"incorrect by strategy '{by}'")
         if by == By.XPATH:
             return self.find_elements_by_xpath(value=value, visible=visible)
-        jabelements = []
-        for jabelement in self._generate_all_childs(visible=visible):
-            if self._is_element_matched(by=by, value=value, jabelement=jabelement):
-                jabelements.append(jabelement)
-                continue
-            self.release_jabelement(jabelement)
+        jabelements = list(self.iter_elements(by=by, value=value, visible=visible))
         if not jabelements:
             raise JABException(
                 f"no JABElement found by '{by}' with locator '{value}'"
             )
         return jabelements
 
+    def iter_elements(
+            self, by: str = By.NAME, value: Union[list, str, int] = None, visible: bool = False
+    ) -> Generator[JABElement]:
+        """Generate JABElement given a By strategy and locator.
+
+        The tree is walked lazily, the walk stops when the caller stops iterating.
+        Nothing is generated if no JABElement matched.
+
+        Args:
+            by (str, optional): By strategy of element need to find. Defaults to By.NAME.
+            value (Any, optional): Locator of element need to find.
+            Defaults to None will select all child jab elements.
+            visible (bool, optional): The switch for find only visible child jab elements or not.
+            Defaults to False to find all child elements.
+
+        Yields:
+            Generator: Generator of JABElement matched by locator.
+        """
+        if by not in [
+            By.NAME,
+            By.DESCRIPTION,
+            By.ROLE,
+            By.STATES,
+            By.OBJECT_DEPTH,
+            By.CHILDREN_COUNT,
+            By.INDEX_IN_PARENT,
+            By.XPATH,
+        ]:
+            raise JABException(f"incorrect by strategy '{by}'")
+        if by == By.XPATH:
+            # xpath is matched level by level, each level is needed in full
+            try:
+                yield from self.find_elements_by_xpath(value=value, visible=visible)
+            except JABException:
+                pass
+            return
+        for jabelement in self._generate_all_childs(visible=visible):
+            if self._is_element_matched(by=by, value=value, jabelement=jabelement):
+                yield jabelement
+                continue
+            self.release_jabelement(jabelement)
+
     @staticmethod
     def _is_element_matched(jabelement: JABElement, by: str, value: Optional[str]):
         return any(
@@ -1595,12 +2090,14 @@ class JABElement(object):
     @property
     def size(self) -> dict:
         """The size of the element."""
-        return dict(height=self.bounds.get("height"), width=self.bounds.get("width"))
+        bounds = self.bounds
+        return dict(height=bounds.get("height"), width=bounds.get("width"))
 
     @property
     def location(self) -> dict:
         """The location of the element in the renderable canvas."""
-        return dict(x=self.bounds.get("x"), y=self.bounds.get("y"))
+        bounds = self.bounds
+        return dict(x=bounds.get("x"), y=bounds.get("y"))
 
     def get_screenshot_as_file(self, filename: str) -> None:
         """
@@ -1626,20 +2123,8 @@ class JABElement(object):
             img = element.get_screenshot()
         """
         self.win32_utils._set_window_foreground(hwnd=self.hwnd)
-        x = self.bounds.get("x")
-        y = self.bounds.get("y")
-        width = self.bounds.get("width")
-        height = self.bounds.get("height")
-        return ImageGrab.grab(
-            bbox=(
-                x,
-                y,
-                x + width,
-                y + height,
-            ),
-            include_layered_windows=False,
-            all_screens=True,
-        )
+        x, y, width, height = _get_bbox_fields(self.bounds)
+        return self.win32_utils._grab_screen(x, y, width, height)
 
     @property
     def parent(self):
@@ -1652,6 +2137,25 @@ class JABElement(object):
             accessible_context=parent_acc,
         )
 
+    def get_parent_with_role(self, role: str) -> Optional[JABElement]:
+        """Get the nearest parent JABElement with specific role.
+
+        Args:
+            role (str): Role of parent JABElement.
+
+        Returns:
+            Optional[JABElement]: Parent JABElement if found, otherwise return None.
+        """
+        parent_acc = self._get_parent_with_role(role)
+        if not parent_acc:
+            return None
+        return JABElement(
+            bridge=self.bridge,
+            hwnd=self.hwnd,
+            vmid=self.vmid,
+            accessible_context=parent_acc,
+        )
+
     def get_cell(self, row: int, column: int, visible: bool = False) -> JABElement:
         """Get cell JABElement from table
 
@@ -1686,33 +2190,53 @@ class JABElement(object):
         Returns:
             dict: Dict information of current JABElement
         """
+        # every field below comes from one Accessible Context Info read
+        acc_info = self._acc_info()
         info = {
-            "name": self.name,
-            "description": self.description,
-            "role": self.role,
-            "role_en_us": self.role_en_us,
-            "states": self.states,
-            "states_en_us": self.states_en_us,
-            "bounds": self.bounds,
+            "name": acc_info.name,
+            "description": acc_info.description,
+            "role": acc_info.role,
+            "role_en_us": acc_info.role_en_US,
+            "states": acc_info.states.split(","),
+            "states_en_us": acc_info.states_en_US.split(","),
+            "bounds": {
+                "x": acc_info.x,
+                "y": acc_info.y,
+                "height": acc_info.height,
+                "width": acc_info.width,
+            },
             "object_depth": self.object_depth,
-            "index_in_parent": self.index_in_parent,
-            "children_count": self.children_count,
-            "accessible_component": self.accessible_component,
-            "accessible_action": self.accessible_action,
-            "accessible_selection": self.accessible_selection,
-            "accessible_text": self.accessible_text,
+            "index_in_parent": acc_info.indexInParent,
+            "children_count": acc_info.childrenCount,
+            "accessible_component": bool(acc_info.accessibleComponent),
+            "accessible_action": bool(acc_info.accessibleAction),
+            "accessible_selection": bool(acc_info.accessibleSelection),
+            "accessible_text": bool(acc_info.accessibleText),
         }
-        if self.accessible_text:
+        if info["accessible_text"]:
             info["text"] = self.text
-        if self.role_en_us == Role.TABLE:
+        if info["role_en_us"] == Role.TABLE:
             info["table"] = self.table
         return info
 
     @staticmethod
-    def _wait_for_value_to_be(expected_value: Optional[str], actual_value, timeout: int = 5,
-                              error_msg_function: str = None):
-        start = time()
+    def _wait_for_value_to_be(expected_value: Optional[str], get_actual_value: Callable[[], Any],
+                              timeout: int = 5, error_msg_function: str = None):
+        """Poll until the actual value equals the expected value, or is empty if None expected.
+
+        Args:
+            expected_value (Optional[str]): Expected value, None to wait for an empty value.
+            get_actual_value (Callable[[], Any]): Reads the actual value, called on every poll.
+            timeout (int, optional): The timeout seconds. Defaults to 5.
+            error_msg_function (str, optional): Action named in the timeout error. Defaults to None.
+
+        Raises:
+            TimeoutError: Value not reached in timeout seconds.
+        """
+        # monotonic deadline, not affected by system clock changes
+        deadline = monotonic() + timeout
         while True:
+            actual_value = get_actual_value()
             if (
                     expected_value
                     and actual_value == expected_value
@@ -1720,28 +2244,37 @@ class JABElement(object):
                     and not actual_value
             ):
                 return
-            current = time()
-            elapsed = round(current - start)
-            if elapsed >= timeout:
+            if monotonic() >= deadline:
                 if error_msg_function:
                     _error_msg = f"Failed to {error_msg_function} in '{timeout}' seconds"
                 else:
                     _error_msg = f"Failed to wait for expected value '{expected_value}' in '{timeout}' seconds"
                 raise TimeoutError(_error_msg)
+            sleep(POLL_INTERVAL)
 
     @staticmethod
-    def _wait_for_value_to_contain(expected_values: Union[str, list[str]], actual_values, timeout: int = 5,
-                                   error_msg_function: str = None):
-        start = time()
+    def _wait_for_value_to_contain(expected_values: Union[str, list[str]], get_actual_values: Callable[[], Iterable],
+                                   timeout: int = 5, error_msg_function: str = None):
+        """Poll until any of the actual values is one of the expected values.
+
+        Args:
+            expected_values (Union[str, list[str]]): Expected values.
+            get_actual_values (Callable[[], Iterable]): Reads the actual values, called on every poll.
+            timeout (int, optional): The timeout seconds. Defaults to 5.
+            error_msg_function (str, optional): Action named in the timeout error. Defaults to None.
+
+        Raises:
+            TimeoutError: No expected value reached in timeout seconds.
+        """
+        deadline = monotonic() + timeout
         while True:
-            if any(v in expected_values for v in actual_values):
+            if any(v in expected_values for v in get_actual_values()):
                 return
-            current = time()
-            elapsed = round(current - start)
-            if elapsed >= timeout:
+            if monotonic() >= deadline:
                 if error_msg_function:
                     _error_msg = f"Failed to {error_msg_function} in '{timeout}' seconds"
                 else:
                     _expected_values = ", ".join(expected_values)
                     _error_msg = f"Failed to wait for expected values '{_expected_values}' in '{timeout}' seconds"
                 raise TimeoutError(_error_msg)
+            sleep(POLL_INTERVAL)
@@ -8,6 +8,7 @@ from ctypes import c_wchar
 from ctypes import POINTER
 from ctypes.wintypes import BOOL
 from ctypes.wintypes import HWND
+from weakref import WeakSet
 from pyjab.accessibleinfo import AccessBridgeVersionInfo
 from pyjab.accessibleinfo import AccessibleActions
 from pyjab.accessibleinfo import AccessibleActionsToDo
@@ -22,322 +23,253 @@ from pyjab.accessibleinfo import AccessibleTextItemsInfo
 from pyjab.accessibleinfo import AccessibleTextRectInfo
 from pyjab.accessibleinfo import AccessibleTextSelectionInfo
 from pyjab.accessibleinfo import VisibleChildrenInfo
+from pyjab.common.exceptions import JABException
 from pyjab.common.logger import Logger
 from pyjab.common.types import JOBJECT64
 
+# pointer types shared by the bridge function signatures
+LP_c_char = POINTER(c_char)
+LP_c_int = POINTER(c_int)
+LP_c_long = POINTER(c_long)
+LP_c_short = POINTER(c_short)
+LP_c_wchar = POINTER(c_wchar)
+LP_JOBJECT64 = POINTER(JOBJECT64)
+
+# (restype, name, argtypes, errorcheck) of the access bridge dll functions
+_BRIDGE_FUNCTIONS = (
+    (None, "Windows_run", (), False),
+    (None, "setFocusGainedFP", (c_void_p,), False),
+    (None, "setFocusLostFP", (c_void_p,), False),
+    (None, "setPropertyChangeFP", (c_void_p,), False),
+    (None, "setPropertyChildChangeFP", (c_void_p,), False),
+    (None, "setPropertyNameChangeFP", (c_void_p,), False),
+    (None, "setPropertyDescriptionChangeFP", (c_void_p,), False),
+    (None, "setPropertyValueChangeFP", (c_void_p,), False),
+    (None, "setPropertyStateChangeFP", (c_void_p,), False),
+    (None, "setPropertyCaretChangeFP", (c_void_p,), False),
+    (None, "setPropertyActiveDescendentChangeFP", (c_void_p,), False),
+    (None, "releaseJavaObject", (c_long, JOBJECT64), False),
+    (BOOL, "getVersionInfo", (c_long, POINTER(AccessBridgeVersionInfo)), True),
+    (BOOL, "isJavaWindow", (HWND,), False),
+    (BOOL, "isSameObject", (c_long, JOBJECT64, JOBJECT64), False),
+    (
+        BOOL,
+        "getAccessibleContextFromHWND",
+        (HWND, LP_c_long, LP_JOBJECT64),
+        True,
+    ),
+    (HWND, "getHWNDFromAccessibleContext", (c_long, JOBJECT64), True),
+    (
+        BOOL,
+        "getAccessibleContextAt",
+        (c_long, JOBJECT64, c_int, c_int, LP_JOBJECT64),
+        False,
+    ),
+    (
+        BOOL,
+        "getAccessibleContextWithFocus",
+        (HWND, LP_c_long, LP_JOBJECT64),
+        False,
+    ),
+    (
+        BOOL,
+        "getAccessibleContextInfo",
+        (c_long, JOBJECT64, POINTER(AccessibleContextInfo)),
+        True,
+    ),
+    (JOBJECT64, "getAccessibleChildFromContext", (c_long, JOBJECT64, c_int), False),
+    (JOBJECT64, "getAccessibleParentFromContext", (c_long, JOBJECT64), False),
+    (JOBJECT64, "getParentWithRole", (c_long, JOBJECT64, LP_c_wchar), False),
+    (
+        BOOL,
+        "getAccessibleRelationSet",
+        (c_long, JOBJECT64, POINTER(AccessibleRelationSetInfo)),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextInfo",
+        (c_long, JOBJECT64, POINTER(AccessibleTextInfo), c_int, c_int),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextItems",
+        (c_long, JOBJECT64, POINTER(AccessibleTextItemsInfo), c_int),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextSelectionInfo",
+        (c_long, JOBJECT64, POINTER(AccessibleTextSelectionInfo)),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextAttributes",
+        (c_long, JOBJECT64, c_int, POINTER(AccessibleTextAttributesInfo)),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextRect",
+        (c_long, JOBJECT64, POINTER(AccessibleTextRectInfo), c_int),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextLineBounds",
+        (c_long, JOBJECT64, c_int, LP_c_int, LP_c_int),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTextRange",
+        (c_long, JOBJECT64, c_int, c_int, LP_c_char, c_short),
+        True,
+    ),
+    (
+        BOOL,
+        "getCurrentAccessibleValueFromContext",
+        (c_long, JOBJECT64, LP_c_wchar, c_short),
+        True,
+    ),
+    (
+        BOOL,
+        "getMaximumAccessibleValueFromContext",
+        (c_long, JOBJECT64, LP_c_wchar, c_short),
+        True,
+    ),
+    (
+        BOOL,
+        "getMinimumAccessibleValueFromContext",
+        (c_long, JOBJECT64, LP_c_wchar, c_short),
+        True,
+    ),
+    (BOOL, "selectTextRange", (c_long, JOBJECT64, c_int, c_int), True),
+    (
+        BOOL,
+        "getTextAttributesInRange",
+        (
+            c_long,
+            JOBJECT64,
+            c_int,
+            c_int,
+            POINTER(AccessibleTextAttributesInfo),
+            LP_c_short,
+        ),
+        True,
+    ),
+    (JOBJECT64, "getTopLevelObject", (c_long, JOBJECT64), True),
+    (c_int, "getObjectDepth", (c_long, JOBJECT64), False),
+    (JOBJECT64, "getActiveDescendent", (c_long, JOBJECT64), False),
+    (BOOL, "requestFocus", (c_long, JOBJECT64), False),
+    (BOOL, "setCaretPosition", (c_long, JOBJECT64, c_int), True),
+    (
+        BOOL,
+        "getCaretLocation",
+        (c_long, JOBJECT64, POINTER(AccessibleTextRectInfo), c_int),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleActions",
+        (c_long, JOBJECT64, POINTER(AccessibleActions)),
+        False,
+    ),
+    (
+        BOOL,
+        "doAccessibleActions",
+        (c_long, JOBJECT64, POINTER(AccessibleActionsToDo), LP_c_int),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTableInfo",
+        (c_long, JOBJECT64, POINTER(AccessibleTableInfo)),
+        False,
+    ),
+    (
+        BOOL,
+        "getAccessibleTableCellInfo",
+        (c_long, JOBJECT64, c_int, c_int, POINTER(AccessibleTableCellInfo)),
+        True,
+    ),
+    (
+        BOOL,
+        "getAccessibleTableRowHeader",
+        (c_long, JOBJECT64, POINTER(AccessibleTableInfo)),
+        False,
+    ),
+    (
+        BOOL,
+        "getAccessibleTableColumnHeader",
+        (c_long, JOBJECT64, POINTER(AccessibleTableInfo)),
+        False,
+    ),
+    (JOBJECT64, "getAccessibleTableRowDescription", (c_long, JOBJECT64, c_int), False),
+    (
+        JOBJECT64,
+        "getAccessibleTableColumnDescription",
+        (c_long, JOBJECT64, c_int),
+        False,
+    ),
+    (c_int, "getAccessibleTableRow", (c_long, JOBJECT64, c_int), False),
+    (c_int, "getAccessibleTableColumn", (c_long, JOBJECT64, c_int), False),
+    (c_int, "getAccessibleTableIndex", (c_long, JOBJECT64, c_int, c_int), False),
+    (
+        BOOL,
+        "getAccessibleKeyBindings",
+        (c_long, JOBJECT64, POINTER(AccessibleKeyBindings)),
+        True,
+    ),
+    (BOOL, "setTextContents", (c_long, JOBJECT64, LP_c_wchar), False),
+    (None, "clearAccessibleSelectionFromContext", (c_long, JOBJECT64), False),
+    (None, "addAccessibleSelectionFromContext", (c_long, JOBJECT64, c_int), False),
+    (None, "removeAccessibleSelectionFromContext", (c_long, JOBJECT64, c_int), False),
+    (JOBJECT64, "getAccessibleSelectionFromContext", (c_long, JOBJECT64, c_int), False),
+    (c_int, "getAccessibleSelectionCountFromContext", (c_long, JOBJECT64), False),
+    (BOOL, "isAccessibleChildSelectedFromContext", (c_long, JOBJECT64, c_int), False),
+    (c_int, "getVisibleChildrenCount", (c_long, JOBJECT64), False),
+    (
+        BOOL,
+        "getVisibleChildren",
+        (c_long, JOBJECT64, c_int, POINTER(VisibleChildrenInfo)),
+        True,
+    ),
+)
+
 
 class JABFixedFunc(object):
+    log = Logger("pyjab")
+    # bridges with functions already fixed, fixing again is a no-op
+    _fixed_bridges = WeakSet()
+
     def __init__(self, bridge: CDLL) -> None:
-        self.log = Logger("pyjab")
         self.bridge = bridge
 
     @staticmethod
     def _check_error(result, func, args):
         if not result:
-            raise RuntimeError(f"Result {result}")
+            raise JABException(f"Java Access Bridge func '{func.__name__}' error")
         return result
 
     def _fix_bridge_function(self, restype, name, *argtypes, **kwargs):
         try:
             func = getattr(self.bridge, name)
         except AttributeError:
-            self.log.error(
-                f"{name} not found in Java Access Bridge DLL"
-            )
+            self.log.error("%s not found in Java Access Bridge DLL", name)
             return
         func.restype = restype
         func.argtypes = argtypes
+        # ctypes only honors the errcheck attribute
         if kwargs.get("errorcheck"):
-            func.errorcheck = self._check_error
+            func.errcheck = JABFixedFunc._check_error
 
     def _fix_bridge_functions(self):
         """Appropriately set the return and argument types of all the access bridge dll functions"""
-        self._fix_bridge_function(None, "Windows_run")
-        self._fix_bridge_function(None, "setFocusGainedFP", c_void_p)
-        self._fix_bridge_function(None, "setPropertyNameChangeFP", c_void_p)
-        self._fix_bridge_function(None, "setPropertyDescriptionChangeFP", c_void_p)
-        self._fix_bridge_function(None, "setPropertyValueChangeFP", c_void_p)
-        self._fix_bridge_function(None, "setPropertyStateChangeFP", c_void_p)
-        self._fix_bridge_function(None, "setPropertyCaretChangeFP", c_void_p)
-        self._fix_bridge_function(None, "setPropertyActiveDescendentChangeFP", c_void_p)
-        self._fix_bridge_function(None, "releaseJavaObject", c_long, JOBJECT64)
-        self._fix_bridge_function(
-            BOOL,
-            "getVersionInfo",
-            c_long,
-            POINTER(AccessBridgeVersionInfo),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(BOOL, "isJavaWindow", HWND)
-        self._fix_bridge_function(BOOL, "isSameObject", c_long, JOBJECT64, JOBJECT64)
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleContextFromHWND",
-            HWND,
-            POINTER(c_long),
-            POINTER(JOBJECT64),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            HWND, "getHWNDFromAccessibleContext", c_long, JOBJECT64, errorcheck=True
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleContextAt",
-            c_long,
-            JOBJECT64,
-            c_int,
-            c_int,
-            POINTER(JOBJECT64),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleContextWithFocus",
-            HWND,
-            POINTER(c_long),
-            POINTER(JOBJECT64),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleContextInfo",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleContextInfo),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            JOBJECT64,
-            "getAccessibleChildFromContext",
-            c_long,
-            JOBJECT64,
-            c_int,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            JOBJECT64, "getAccessibleParentFromContext", c_long, JOBJECT64
-        )
-        self._fix_bridge_function(
-            JOBJECT64, "getParentWithRole", c_long, JOBJECT64, POINTER(c_wchar)
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleRelationSet",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleRelationSetInfo),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextInfo",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTextInfo),
-            c_int,
-            c_int,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextItems",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTextItemsInfo),
-            c_int,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextSelectionInfo",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTextSelectionInfo),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextAttributes",
-            c_long,
-            JOBJECT64,
-            c_int,
-            POINTER(AccessibleTextAttributesInfo),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextRect",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTextRectInfo),
-            c_int,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextLineBounds",
-            c_long,
-            JOBJECT64,
-            c_int,
-            POINTER(c_int),
-            POINTER(c_int),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTextRange",
-            c_long,
-            JOBJECT64,
-            c_int,
-            c_int,
-            POINTER(c_char),
-            c_short,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getCurrentAccessibleValueFromContext",
-            c_long,
-            JOBJECT64,
-            POINTER(c_wchar),
-            c_short,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL, "selectTextRange", c_long, JOBJECT64, c_int, c_int, errorcheck=True
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getTextAttributesInRange",
-            c_long,
-            JOBJECT64,
-            c_int,
-            c_int,
-            POINTER(AccessibleTextAttributesInfo),
-            POINTER(c_short),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            JOBJECT64, "getTopLevelObject", c_long, JOBJECT64, errorcheck=True
-        )
-        self._fix_bridge_function(c_int, "getObjectDepth", c_long, JOBJECT64)
-        self._fix_bridge_function(JOBJECT64, "getActiveDescendent", c_long, JOBJECT64)
-        self._fix_bridge_function(
-            BOOL, "requestFocus", c_long, JOBJECT64, errorcheck=True
-        )
-        self._fix_bridge_function(
-            BOOL, "setCaretPosition", c_long, JOBJECT64, c_int, errorcheck=True
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getCaretLocation",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTextRectInfo),
-            c_int,
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleActions",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleActions),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "doAccessibleActions",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleActionsToDo),
-            POINTER(c_int),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTableInfo",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTableInfo),
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTableCellInfo",
-            c_long,
-            JOBJECT64,
-            c_int,
-            c_int,
-            POINTER(AccessibleTableCellInfo),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTableRowHeader",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTableInfo),
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleTableColumnHeader",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleTableInfo),
-        )
-        self._fix_bridge_function(
-            JOBJECT64, "getAccessibleTableRowDescription", c_long, JOBJECT64, c_int
-        )
-        self._fix_bridge_function(
-            JOBJECT64, "getAccessibleTableColumnDescription", c_long, JOBJECT64, c_int
-        )
-        self._fix_bridge_function(
-            c_int, "getAccessibleTableRow", c_long, JOBJECT64, c_int
-        )
-        self._fix_bridge_function(
-            c_int, "getAccessibleTableColumn", c_long, JOBJECT64, c_int
-        )
-        self._fix_bridge_function(
-            c_int, "getAccessibleTableIndex", c_long, JOBJECT64, c_int, c_int
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getAccessibleKeyBindings",
-            c_long,
-            JOBJECT64,
-            POINTER(AccessibleKeyBindings),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "setTextContents",
-            c_long,
-            JOBJECT64,
-            POINTER(c_wchar),
-            errorcheck=True,
-        )
-        self._fix_bridge_function(
-            None, "clearAccessibleSelectionFromContext", c_long, JOBJECT64
-        )
-        self._fix_bridge_function(
-            None, "addAccessibleSelectionFromContext", c_long, JOBJECT64, c_int
-        )
-        self._fix_bridge_function(
-            JOBJECT64, "getAccessibleSelectionFromContext", c_long, JOBJECT64, c_int
-        )
-        self._fix_bridge_function(
-            c_int,
-            "getVisibleChildrenCount",
-            c_long,
-            JOBJECT64,
-        )
-        self._fix_bridge_function(
-            BOOL,
-            "getVisibleChildren",
-            c_long,
-            JOBJECT64,
-            c_int,
-            POINTER(VisibleChildrenInfo),
-            errorcheck=True,
-        )
+        if self.bridge in self._fixed_bridges:
+            return
+        for restype, name, argtypes, errorcheck in _BRIDGE_FUNCTIONS:
+            self._fix_bridge_function(restype, name, *argtypes, errorcheck=errorcheck)
+        self._fixed_bridges.add(self.bridge)
@@ -0,0 +1,287 @@
+import threading
+
+import pytest
+
+from pyjab.accessibleinfo import VisibleChildren
+from pyjab.common.exceptions import JABException
+from pyjab.jabdriver import JABDriver
+from pyjab.jabelement import JABElement
+
+
+class FakeBridge(object):
+    """Java Access Bridge stand-in serving a tree of Accessible Context ids."""
+
+    def __init__(self, tree: dict, selected: set = None, values: tuple = ("", "", "")) -> None:
+        self.tree = tree
+        self.parents = {child: parent for parent, childs in tree.items() for child in childs}
+        self.selected = set(selected or ())
+        self.values = values
+        self.calls = []
+        self.threads = set()
+        self.released = []
+
+    def _record(self, name: str) -> None:
+        self.calls.append(name)
+        self.threads.add(threading.get_ident())
+
+    def getAccessibleContextInfo(self, vmid, accessible_context, info) -> bool:
+        self._record("getAccessibleContextInfo")
+        ac = getattr(accessible_context, "value", accessible_context)
+        info._obj.childrenCount = len(self.tree.get(ac, ()))
+        info._obj.accessibleSelection = ac in self.tree
+        parent = self.parents.get(ac)
+        info._obj.indexInParent = self.tree[parent].index(ac) if parent else -1
+        return True
+
+    def getAccessibleChildFromContext(self, vmid, accessible_context, index):
+        self._record("getAccessibleChildFromContext")
+        return self.tree[getattr(accessible_context, "value", accessible_context)][index]
+
+    def getAccessibleSelectionCountFromContext(self, vmid, accessible_context) -> int:
+        return len(self.selected)
+
+    def getAccessibleSelectionFromContext(self, vmid, accessible_context, index):
+        childs = self.tree[getattr(accessible_context, "value", accessible_context)]
+        return childs[sorted(self.selected)[index]]
+
+    def isAccessibleChildSelectedFromContext(self, vmid, accessible_context, index) -> bool:
+        return index in self.selected
+
+    def addAccessibleSelectionFromContext(self, vmid, accessible_context, index) -> None:
+        self._record("addAccessibleSelectionFromContext")
+        self.selected.add(index)
+
+    def removeAccessibleSelectionFromContext(self, vmid, accessible_context, index) -> None:
+        self._record("removeAccessibleSelectionFromContext")
+        self.selected.discard(index)
+
+    def clearAccessibleSelectionFromContext(self, vmid, accessible_context) -> None:
+        self._record("clearAccessibleSelectionFromContext")
+        self.selected.clear()
+
+    def getCurrentAccessibleValueFromContext(self, vmid, accessible_context, buffer, size) -> bool:
+        buffer.value = self.values[0]
+        return True
+
+    def getMinimumAccessibleValueFromContext(self, vmid, accessible_context, buffer, size) -> bool:
+        buffer.value = self.values[1]
+        return True
+
+    def getMaximumAccessibleValueFromContext(self, vmid, accessible_context, buffer, size) -> bool:
+        buffer.value = self.values[2]
+        return True
+
+    def getTopLevelObject(self, vmid, accessible_context) -> int:
+        self._record("getTopLevelObject")
+        return 100 + len(self.calls)
+
+    def releaseJavaObject(self, vmid, obj) -> None:
+        self.released.append(getattr(obj, "value", obj))
+
+
+TREE = {1: [2, 3], 2: [4, 5, 6], 3: [7], 6: [8], 7: []}
+# selector with five options
+SELECTOR = {1: [10, 11, 12, 13, 14]}
+
+
+def get_element(bridge: FakeBridge, accessible_context: int = 1) -> JABElement:
+    return JABElement(bridge=bridge, hwnd=None, vmid=1, accessible_context=accessible_context)
+
+
+def get_selection_calls(bridge: FakeBridge) -> list:
+    return [call for call in bridge.calls if "Selection" in call]
+
+
+class TestWalkAllChilds(object):
+    def test_walk_all_childs(self) -> None:
+        bridge = FakeBridge(TREE)
+        childs = get_element(bridge).walk_all_childs()
+        assert sorted(child.accessible_context for child in childs) == [2, 3, 4, 5, 6, 7, 8]
+
+    def test_walk_all_childs_one_info_per_node(self) -> None:
+        bridge = FakeBridge(TREE)
+        childs = get_element(bridge).walk_all_childs()
+        # root and every child once, parents are not asked for their count again
+        assert bridge.calls.count("getAccessibleContextInfo") == len(childs) + 1
+        assert bridge.calls.count("getAccessibleChildFromContext") == len(childs)
+
+    def test_walk_all_childs_on_calling_thread(self) -> None:
+        bridge = FakeBridge(TREE)
+        get_element(bridge).walk_all_childs()
+        assert bridge.threads == {threading.get_ident()}
+
+    def test_walk_all_childs_no_child(self) -> None:
+        bridge = FakeBridge({1: []})
+        assert get_element(bridge).walk_all_childs() == []
+        assert not bridge.released
+
+    def test_walk_all_childs_skips_null_child(self) -> None:
+        bridge = FakeBridge({1: [2, 0], 2: []})
+        childs = get_element(bridge).walk_all_childs()
+        assert [child.accessible_context for child in childs] == [2]
+
+
+class TestTopLevelObject(object):
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        JABElement.invalidate_all()
+
+    def test_top_level_object_caller_owned(self) -> None:
+        bridge = FakeBridge(TREE)
+        element = get_element(bridge, accessible_context=4)
+        assert element._get_top_level_object() != element._get_top_level_object()
+        assert bridge.calls.count("getTopLevelObject") == 2
+
+    def test_cached_top_level_object(self) -> None:
+        bridge = FakeBridge(TREE)
+        element = get_element(bridge, accessible_context=4)
+        top_object = element._get_cached_top_level_object()
+        assert element._get_cached_top_level_object() == top_object
+        assert bridge.calls.count("getTopLevelObject") == 1
+        assert bridge.released == []
+
+    def test_cached_top_level_object_released_by_cache(self) -> None:
+        bridge = FakeBridge(TREE)
+        element = get_element(bridge, accessible_context=4)
+        top_object = element._get_cached_top_level_object()
+        element.release_jabelement()
+        assert bridge.released == [top_object, 4]
+
+
+class TestSelection(object):
+    def test_select_indexes(self) -> None:
+        bridge = FakeBridge(SELECTOR, selected={0, 1})
+        get_element(bridge).select_indexes([1, 3])
+        assert bridge.selected == {1, 3}
+        assert get_selection_calls(bridge) == [
+            "removeAccessibleSelectionFromContext",
+            "addAccessibleSelectionFromContext",
+        ]
+
+    def test_select_indexes_unchanged(self) -> None:
+        bridge = FakeBridge(SELECTOR, selected={2})
+        get_element(bridge).select_indexes([2])
+        assert bridge.selected == {2}
+        assert get_selection_calls(bridge) == []
+
+    def test_select_indexes_empty(self) -> None:
+        bridge = FakeBridge(SELECTOR, selected={0, 1, 2})
+        get_element(bridge).select_indexes([])
+        assert bridge.selected == set()
+        # one clear instead of three removes
+        assert get_selection_calls(bridge) == ["clearAccessibleSelectionFromContext"]
+
+    def test_select_indexes_duplicate(self) -> None:
+        bridge = FakeBridge(SELECTOR)
+        get_element(bridge).select_indexes([4, 4, 4])
+        assert bridge.selected == {4}
+        assert get_selection_calls(bridge) == ["addAccessibleSelectionFromContext"]
+
+    @pytest.mark.parametrize("indexes", [[5], [-1], [0, 99]])
+    def test_select_indexes_out_of_range(self, indexes) -> None:
+        bridge = FakeBridge(SELECTOR, selected={0})
+        with pytest.raises(ValueError):
+            get_element(bridge).select_indexes(indexes)
+        assert bridge.selected == {0}
+
+    def test_select_indexes_not_selector(self) -> None:
+        bridge = FakeBridge(SELECTOR)
+        with pytest.raises(JABException):
+            get_element(bridge, accessible_context=10).select_indexes([0])
+
+    def test_selected_children_released(self) -> None:
+        bridge = FakeBridge(SELECTOR, selected={1, 3})
+        get_element(bridge).select_indexes([1])
+        assert sorted(bridge.released) == [11, 13]
+
+    def test_get_selection_mask(self) -> None:
+        bridge = FakeBridge(SELECTOR, selected={0, 3})
+        assert get_element(bridge).get_selection_mask() == [True, False, False, True, False]
+
+    def test_get_selection_mask_empty(self) -> None:
+        bridge = FakeBridge({1: []})
+        assert get_element(bridge).get_selection_mask() == []
+
+
+class TestValueRange(object):
+    def test_value_range(self) -> None:
+        bridge = FakeBridge(SELECTOR, values=("5", "0", "10"))
+        assert get_element(bridge).value_range == {"current": "5", "minimum": "0", "maximum": "10"}
+
+    def test_value_range_buffer_not_shared(self) -> None:
+        # the three values share one buffer, a longer value must not leak into a shorter one
+        bridge = FakeBridge(SELECTOR, values=("12345", "1", ""))
+        assert get_element(bridge).value_range == {"current": "12345", "minimum": "1", "maximum": ""}
+
+
+class TestFindElementsByPredicate(object):
+    @pytest.fixture
+    def driver(self) -> JABDriver:
+        driver = JABDriver.__new__(JABDriver)
+        driver._root_element = get_element(FakeBridge(TREE))
+        return driver
+
+    def test_find_elements_by_predicate(self, driver) -> None:
+        jabelements = driver.find_elements_by_predicate(
+            lambda jabelement: jabelement.accessible_context % 2 == 0
+        )
+        # breadth first, one level after another
+        assert [jabelement.accessible_context for jabelement in jabelements] == [2, 4, 6, 8]
+
+    def test_find_elements_by_predicate_root(self, driver) -> None:
+        jabelements = driver.find_elements_by_predicate(lambda jabelement: True)
+        assert [jabelement.accessible_context for jabelement in jabelements] == [1, 2, 3, 4, 5, 6, 7, 8]
+        assert driver.root_element.bridge.released == []
+
+    def test_find_elements_by_predicate_releases_unmatched(self, driver) -> None:
+        jabelements = driver.find_elements_by_predicate(
+            lambda jabelement: jabelement.accessible_context == 8
+        )
+        assert [jabelement.accessible_context for jabelement in jabelements] == [8]
+        assert sorted(driver.root_element.bridge.released) == [2, 3, 4, 5, 6, 7]
+
+
+class TestVisibleChildren(object):
+    def test_visible_children(self) -> None:
+        visible_children = VisibleChildren(2, (10, 11))
+        assert visible_children.count == 2
+        assert visible_children.children == (10, 11)
+        assert tuple(visible_children) == (2, (10, 11))
+
+    def test_visible_children_dict_keys(self) -> None:
+        visible_children = VisibleChildren(2, (10, 11))
+        assert visible_children["returned_children_count"] == 2
+        assert visible_children["children"] == (10, 11)
+        assert visible_children[0] == 2
+        assert visible_children[1] == (10, 11)
+
+    def test_visible_children_unknown_key(self) -> None:
+        with pytest.raises(TypeError):
+            VisibleChildren(0, ())["unknown"]
+
+
+class TestWaitForValue(object):
+    def test_wait_for_value_to_be_reads_every_poll(self) -> None:
+        values = iter(["", "a", "ab"])
+        JABElement._wait_for_value_to_be("ab", lambda: next(values), timeout=1)
+
+    def test_wait_for_value_to_be_empty(self) -> None:
+        values = iter(["ab", "a", ""])
+        JABElement._wait_for_value_to_be(None, lambda: next(values), timeout=1)
+
+    def test_wait_for_value_to_be_timeout(self) -> None:
+        reads = []
+        with pytest.raises(TimeoutError, match="clear text"):
+            JABElement._wait_for_value_to_be(
+                None, lambda: reads.append(1) or "ab", timeout=0, error_msg_function="clear text"
+            )
+        # the value is read once even when the deadline already passed
+        assert reads == [1]
+
+    def test_wait_for_value_to_contain_reads_every_poll(self) -> None:
+        values = iter([["enabled"], ["enabled", "selected"]])
+        JABElement._wait_for_value_to_contain(["selected", "checked"], lambda: next(values), timeout=1)
+
+    def test_wait_for_value_to_contain_timeout(self) -> None:
+        with pytest.raises(TimeoutError, match="selected, checked"):
+            JABElement._wait_for_value_to_contain(["selected", "checked"], lambda: ["enabled"], timeout=0)
@@ -0,0 +1,66 @@
+import pytest
+
+from pyjab.common.exceptions import JABException
+from pyjab.common.types import JOBJECT64
+from pyjab.jabfixedfunc import _BRIDGE_FUNCTIONS, JABFixedFunc
+
+
+class FakeFunc(object):
+    def __init__(self, name: str) -> None:
+        self.__name__ = name
+
+
+class FakeBridge(object):
+    """CDLL stand-in, every function attribute is created on first lookup like ctypes."""
+
+    def __getattr__(self, name: str) -> FakeFunc:
+        func = FakeFunc(name)
+        setattr(self, name, func)
+        return func
+
+
+# functions whose callers handle a falsy result themselves
+UNCHECKED = (
+    "getAccessibleContextAt",
+    "getAccessibleContextWithFocus",
+    "getAccessibleChildFromContext",
+    "requestFocus",
+    "getAccessibleActions",
+    "setTextContents",
+)
+
+
+@pytest.fixture
+def bridge() -> FakeBridge:
+    bridge = FakeBridge()
+    JABFixedFunc(bridge)._fix_bridge_functions()
+    return bridge
+
+
+class TestJABFixedFunc(object):
+    def test_errcheck_installed(self, bridge) -> None:
+        for _, name, _, errorcheck in _BRIDGE_FUNCTIONS:
+            func = getattr(bridge, name)
+            assert not hasattr(func, "errorcheck")
+            assert (getattr(func, "errcheck", None) is not None) == errorcheck, name
+
+    def test_falsy_result_callers_unchecked(self, bridge) -> None:
+        for name in UNCHECKED:
+            assert not hasattr(getattr(bridge, name), "errcheck"), name
+
+    @pytest.mark.parametrize("result", [0, False, JOBJECT64(0)])
+    def test_errcheck_raises_on_falsy_result(self, bridge, result) -> None:
+        func = bridge.getAccessibleContextInfo
+        with pytest.raises(JABException, match="getAccessibleContextInfo"):
+            func.errcheck(result, func, ())
+
+    @pytest.mark.parametrize("result", [1, True, JOBJECT64(5)])
+    def test_errcheck_returns_result(self, bridge, result) -> None:
+        func = bridge.getTopLevelObject
+        assert func.errcheck(result, func, ()) is result
+
+    def test_fix_bridge_functions_once(self, bridge) -> None:
+        func = bridge.getAccessibleContextInfo
+        func.argtypes = None
+        JABFixedFunc(bridge)._fix_bridge_functions()
+        assert func.argtypes is None